@@ -1,8 +1,11 @@
 import sys
-import random
+import threading
 import pygame
 from typing import List, Optional, Tuple
 
+import freecell_rules as rules
+import freecell_solver as solver
+
 # ----------------------------
 # FreeCell in Pygame
 # Controls
@@ -10,6 +13,10 @@ from typing import List, Optional, Tuple
 #  - Double-click a card to try auto-move to foundation
 #  - R: Restart / new deal
 #  - U or Ctrl+Z: Undo last move
+#  - H: Hint (the solver outlines a next move from a winning line; it
+#    searches in a background thread so the window keeps drawing)
+# The rules live in freecell_rules; this module only draws the current
+# rules.State and turns mouse gestures into rules.Move values.
 # ----------------------------
 
 pygame.init()
@@ -20,6 +27,7 @@ SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("FreeCell (Pygame)")
 FPS = 60
 CLOCK = pygame.time.Clock()
+HINT_TIME_LIMIT = 1.0  # seconds the solver may spend on a hint
 
 # --- Colors ---
 GREEN = (20, 110, 20)
@@ -46,9 +54,9 @@ BIG_FONT = pygame.font.SysFont("arial", 32, bold=True)
 SMALL_FONT = pygame.font.SysFont("arial", 18)
 
 # --- Suits & Ranks ---
-SUITS = ["♠", "♥", "♦", "♣"]
+SUITS = rules.SUITS
 SUIT_COLORS = {"♠": BLACK, "♣": BLACK, "♥": RED, "♦": RED}
-RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+RANKS = rules.RANKS
 RANK_TO_VAL = {r: i + 1 for i, r in enumerate(RANKS)}
 VAL_TO_RANK = {v: r for r, v in RANK_TO_VAL.items()}
 
@@ -85,28 +93,17 @@ def rounded_rect(surface, rect, color, radius):
 
 # --- Data Model ---
 class Card:
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-        self.value = RANK_TO_VAL[rank]
-        self.color = SUIT_COLORS[suit]
+    """View of a rules card (an int, suit * 13 + rank)."""
+    def __init__(self, code: int):
+        self.code = code
+        self.suit = SUITS[rules.SUIT_OF[code]]
+        self.rank = RANKS[rules.RANK_OF[code]]
+        self.value = RANK_TO_VAL[self.rank]
+        self.color = SUIT_COLORS[self.suit]
         self.face_up = True  # all cards are face-up in FreeCell
         self.pos = (0, 0)  # for rendering during drag
         self.offset = (0, 0)
 
-    def can_stack_on_tableau(self, other: Optional["Card"]) -> bool:
-        """Can this card be placed on top of 'other' in tableau rules?"""
-        if other is None:
-            return True  # empty column accepts any card
-        # alternating colors and descending by 1
-        return (self.color != other.color) and (self.value == other.value - 1)
-
-    def can_place_on_foundation(self, other: Optional["Card"]) -> bool:
-        """Can this card be placed on top of 'other' in foundation rules?"""
-        if other is None:
-            return self.value == 1  # Ace only
-        return (self.suit == other.suit) and (self.value == other.value + 1)
-
     def draw(self, surface, x, y, highlight=False, shadow=False):
         rect = (x, y, CARD_W, CARD_H)
         # shadow
@@ -134,30 +131,19 @@ class Card:
         return f"{self.rank}{self.suit}"
 
 
-class Move:
-    """Represents a move for undo functionality."""
-    def __init__(self, src, dst, cards: List[Card]):
-        self.src = src
-        self.dst = dst
-        self.cards = cards
+# One view object per card, indexed by the rules' card int
+CARDS = [Card(code) for code in range(rules.NUM_CARDS)]
 
 
 class Pile:
-    def __init__(self, pos: Tuple[int, int]):
+    def __init__(self, pos: Tuple[int, int], loc: int):
         self.pos = pos
-        self.cards: List[Card] = []
+        self.loc = loc  # rules location of this pile (column, cell or FOUNDATION)
+        self.cards: List[Card] = []  # mirrored from the rules state by Game.sync
 
     def top(self) -> Optional[Card]:
         return self.cards[-1] if self.cards else None
 
-    def add_cards(self, cards: List[Card]):
-        self.cards.extend(cards)
-
-    def remove_cards(self, n: int) -> List[Card]:
-        removed = self.cards[-n:]
-        self.cards = self.cards[:-n]
-        return removed
-
     def is_point_inside(self, x, y) -> bool:
         px, py = self.pos
         rect = pygame.Rect(px, py, CARD_W, CARD_H)
@@ -172,9 +158,6 @@ class Pile:
 
 
 class FreeCell(Pile):
-    def can_add(self, cards: List[Card]) -> bool:
-        return len(cards) == 1 and len(self.cards) == 0
-
     def draw(self, surface):
         if self.cards:
             self.cards[-1].draw(surface, *self.pos)
@@ -183,16 +166,9 @@ class FreeCell(Pile):
 
 
 class Foundation(Pile):
-    def __init__(self, pos: Tuple[int, int], suit: Optional[str] = None):
-        super().__init__(pos)
-        self.suit = suit  # optional fixed suit, handled dynamically here
-
-    def can_add(self, cards: List[Card]) -> bool:
-        if len(cards) != 1:
-            return False
-        card = cards[0]
-        top = self.top()
-        return card.can_place_on_foundation(top)
+    def __init__(self, pos: Tuple[int, int], suit: int):
+        super().__init__(pos, rules.FOUNDATION)
+        self.suit = suit  # slot i shows suit i; a card dropped on any slot goes to its suit
 
     def draw(self, surface):
         if self.cards:
@@ -220,15 +196,6 @@ class Tableau(Pile):
         sp = max(MIN_SP, int(avail / (n - 1)))
         return sp
 
-    def can_add(self, cards: List[Card]) -> bool:
-        if not cards:
-            return False
-        # incoming 'cards' must be a valid descending alternating sequence
-        if not is_valid_descending_sequence(cards):
-            return False
-        top = self.top()
-        return cards[0].can_stack_on_tableau(top)
-
     def get_click_index(self, x, y) -> Optional[int]:
         px, py = self.pos
         sp = self.tableau_spacing()
@@ -256,59 +223,21 @@ class Tableau(Pile):
         for i, card in enumerate(self.cards):
             cy = y + i * sp
             card.draw(surface, x, cy, shadow=True)
-        x, y = self.pos
-        if not self.cards:
-            # empty placeholder
-            rounded_rect(surface, (x, y, CARD_W, CARD_H), DARK_GREEN, CARD_RADIUS)
-            pygame.draw.rect(surface, LIGHT_GRAY, (x, y, CARD_W, CARD_H), 2, border_radius=CARD_RADIUS)
-        # stack
-        for i, card in enumerate(self.cards):
-            cy = y + i * CARD_SPACING_Y
-            card.draw(surface, x, cy, shadow=True)
-
-
-# --- Utility functions ---
-def is_valid_descending_sequence(cards: List[Card]) -> bool:
-    if not cards:
-        return False
-    # Must be descending by 1 and alternating colors
-    for i in range(len(cards) - 1):
-        a, b = cards[i], cards[i + 1]
-        if not (a.color != b.color and a.value == b.value + 1):
-            return False
-    return True
-
-
-def count_empty_freecells(freecells: List[FreeCell]) -> int:
-    return sum(1 for f in freecells if not f.cards)
-
-
-def count_empty_tableau_columns(tableaus: List[Tableau], exclude: Optional[Tableau] = None) -> int:
-    c = 0
-    for t in tableaus:
-        if t is not exclude and len(t.cards) == 0:
-            c += 1
-    return c
-
 
-def max_movable_sequence_len(freecells: List[FreeCell], tableaus: List[Tableau], dest: Optional[Tableau]) -> int:
-    """
-    Movement capacity per the user's simplified rule:
-      - You can move sequences of length N where N = total empty spaces + 1,
-        where empty spaces = empty free cells + empty tableau columns (excluding the destination column if it's empty).
-    This is a simpler variant of the classic rule and matches the provided instructions.
-    """
-    empty_free = count_empty_freecells(freecells)
-    empty_tableau = count_empty_tableau_columns(tableaus, exclude=dest)
-    return max(1, empty_free + empty_tableau + 1)
+    def cards_rect(self, n: int) -> pygame.Rect:
+        """Screen area of the top n cards (the empty slot if the column is empty)."""
+        x, y = self.pos
+        sp = self.tableau_spacing()
+        first = max(len(self.cards) - n, 0)
+        return pygame.Rect(x, y + first * sp, CARD_W, (n - 1) * sp + CARD_H)
 
 
 # --- Game State ---
 class Game:
     def __init__(self):
-        self.tableau: List[Tableau] = [Tableau(TABLEAU_POS[i]) for i in range(8)]
-        self.freecells: List[FreeCell] = [FreeCell(FREECELL_POS[i]) for i in range(4)]
-        self.foundations: List[Foundation] = [Foundation(FOUNDATION_POS[i]) for i in range(4)]
+        self.tableau: List[Tableau] = [Tableau(TABLEAU_POS[i], i) for i in range(8)]
+        self.freecells: List[FreeCell] = [FreeCell(FREECELL_POS[i], rules.CELL_BASE + i) for i in range(4)]
+        self.foundations: List[Foundation] = [Foundation(FOUNDATION_POS[i], i) for i in range(4)]
 
         self.drag_cards: List[Card] = []
         self.drag_src: Optional[Pile] = None
@@ -316,33 +245,38 @@ class Game:
         self.drag_offset: Tuple[int, int] = (0, 0)
         self.mouse_down_time: float = 0
         self.last_click_time: float = 0
-        self.undo_stack: List[Move] = []
+        self.undo_stack: List[rules.State] = []
+        self.hint: Optional[rules.Move] = None
+        self.message: str = ""
+        # background hint search: the worker leaves (state searched, result) here
+        self.hint_worker: Optional[threading.Thread] = None
+        self.hint_result: Optional[Tuple[rules.State, solver.SolveResult]] = None
+        self.hint_wanted = False
 
         self.new_deal()
 
     def new_deal(self):
-        # reset
-        for t in self.tableau:
-            t.cards = []
-        for f in self.freecells:
-            f.cards = []
-        for fo in self.foundations:
-            fo.cards = []
         self.drag_cards = []
         self.drag_src = None
         self.undo_stack.clear()
-
-        # create and shuffle deck
-        deck = [Card(s, r) for s in SUITS for r in RANKS]
-        random.shuffle(deck)
-
-        # deal to 8 columns: first 4 get 7, last 4 get 6
-        for i in range(52):
-            col = i % 8
-            self.tableau[col].cards.append(deck[i])
-
-        # Adjust to 7/6 pattern by moving extra from last columns to first four
-        # (Dealing i%8 already gives 7 on first four and 6 on last four with 52 cards.)
+        # shuffle and deal to 8 columns: first 4 get 7, last 4 get 6
+        self.state = rules.deal()
+        self.sync()
+
+    def sync(self):
+        """Mirror the rules state into the piles that get drawn and hit-tested."""
+        columns, cells, found = self.state
+        for t, col in zip(self.tableau, columns):
+            t.cards = [CARDS[c] for c in col]
+        for f, card in zip(self.freecells, cells):
+            f.cards = [] if card == rules.EMPTY else [CARDS[card]]
+        for fo in self.foundations:
+            base = rules.make_card(fo.suit, 0)
+            fo.cards = CARDS[base: base + found[fo.suit]]
+        # any change of state makes an old hint (or one still being searched) stale
+        self.hint = None
+        self.hint_wanted = False
+        self.message = ""
 
     # --- Rendering ---
     def draw(self):
@@ -353,8 +287,11 @@ class Game:
         SCREEN.blit(title, (EDGE_MARGIN, 4))
 
         # Draw top row separators text
-        tip = SMALL_FONT.render("Double-click to auto-move • R: New game • U/Ctrl+Z: Undo", True, WHITE)
+        tip = SMALL_FONT.render("Double-click to auto-move • R: New game • U/Ctrl+Z: Undo • H: Hint", True, WHITE)
         SCREEN.blit(tip, (EDGE_MARGIN, TOP_MARGIN + CARD_H + 30))
+        if self.message:
+            msg = SMALL_FONT.render(self.message, True, YELLOW)
+            SCREEN.blit(msg, (WIDTH - EDGE_MARGIN - msg.get_width(), TOP_MARGIN + CARD_H + 30))
 
         # Draw Freecells
         for f in self.freecells:
@@ -372,6 +309,11 @@ class Game:
         for t in self.tableau:
             t.draw(SCREEN)
 
+        # Outline the hinted cards and where they go
+        if self.hint and not self.drag_cards:
+            for rect in self.hint_rects(self.hint):
+                pygame.draw.rect(SCREEN, YELLOW, rect.inflate(6, 6), width=3, border_radius=CARD_RADIUS)
+
         # Draw dragging cards on top
         if self.drag_cards:
             mx, my = pygame.mouse.get_pos()
@@ -390,7 +332,63 @@ class Game:
 
     # --- Game Logic ---
     def is_victory(self) -> bool:
-        return sum(len(f.cards) for f in self.foundations) == 52
+        return rules.is_won(self.state)
+
+    def pile_for(self, loc: int, card: int) -> Pile:
+        if loc < rules.CELL_BASE:
+            return self.tableau[loc]
+        if loc < rules.FOUNDATION:
+            return self.freecells[loc - rules.CELL_BASE]
+        return self.foundations[rules.SUIT_OF[card]]
+
+    def hint_rects(self, move: rules.Move) -> List[pygame.Rect]:
+        rects = []
+        for loc, n in ((move.src, move.n), (move.dst, 1)):
+            pile = self.pile_for(loc, move.card)
+            if isinstance(pile, Tableau):
+                rects.append(pile.cards_rect(n))
+            else:
+                rects.append(pygame.Rect(pile.pos[0], pile.pos[1], CARD_W, CARD_H))
+        return rects
+
+    def show_hint(self):
+        """Ask for a hint; the search runs in a worker thread and poll_hint shows the answer."""
+        if self.is_victory():
+            return
+        self.hint_wanted = True
+        self.message = "Thinking..."
+        if self.hint_worker is None or not self.hint_worker.is_alive():
+            self.start_hint_search()
+
+    def start_hint_search(self):
+        state = self.state
+
+        def search():
+            self.hint_result = (state, solver.solve(state, time_limit=HINT_TIME_LIMIT))
+
+        self.hint_worker = threading.Thread(target=search, daemon=True)
+        self.hint_worker.start()
+
+    def poll_hint(self):
+        """Called once a frame: show a finished search if it was for the current state."""
+        if self.hint_result is None:
+            return
+        state, result = self.hint_result
+        self.hint_result = None
+        if not self.hint_wanted:
+            return
+        if state != self.state:
+            # the player moved on and asked again while the old search ran
+            self.start_hint_search()
+            return
+        self.hint_wanted = False
+        if result.moves:
+            self.hint = result.moves[0]
+            self.message = "Hint: " + solver.describe_move(self.hint)
+        elif result.solvable is False:
+            self.message = "No solution from here - try undo"
+        else:
+            self.message = "No hint found in time"
 
     def pile_at_point(self, x, y) -> Optional[Pile]:
         # Check freecells
@@ -436,7 +434,7 @@ class Game:
                 return
             # take sequence starting at idx if valid
             seq = pile.cards[idx:]
-            if idx < len(pile.cards) - 1 and not is_valid_descending_sequence(seq):
+            if len(seq) > rules.run_length(self.state.columns[pile.loc]):
                 # if the clicked card isn't the start of a valid sequence, restrict to that single top card
                 seq = pile.cards[-1:]
                 idx = len(pile.cards) - 1
@@ -467,71 +465,23 @@ class Game:
             self.cancel_drag()
             return
 
-        moved = False
+        # The rules check sequence validity, capacity and the destination
         cards = self.drag_cards
-
-        # Determine allowed move size for tableau destination
-        if isinstance(dest, Tableau):
-            max_len = max_movable_sequence_len(self.freecells, self.tableau, dest)
-        else:
-            max_len = 1
-
-        # Validate destination rule
-        if isinstance(dest, FreeCell):
-            if len(cards) == 1 and dest.can_add(cards):
-                self._commit_move(self.drag_src, dest, 1)
-                moved = True
-        elif isinstance(dest, Foundation):
-            if len(cards) == 1 and dest.can_add(cards):
-                self._commit_move(self.drag_src, dest, 1)
-                moved = True
-        elif isinstance(dest, Tableau):
-            # If moving from tableau, ensure the sequence is internally valid and within capacity
-            if len(cards) <= max_len and dest.can_add(cards):
-                n = len(cards)
-                self._commit_move(self.drag_src, dest, n)
-                moved = True
-
-        # If not moved, snap back
-        if not moved:
-            # no state change needed; drag canceled
-            pass
-
+        self.try_move(rules.Move(self.drag_src.loc, dest.loc, len(cards), cards[0].code))
         self.cancel_drag()
 
-    def _commit_move(self, src: Pile, dst: Pile, n: int):
-        # remove from src
-        moved_cards = []
-        if isinstance(src, Tableau) and self.drag_index >= 0:
-            moved_cards = src.cards[self.drag_index: self.drag_index + n]
-            del src.cards[self.drag_index: self.drag_index + n]
-        else:
-            moved_cards = src.remove_cards(n)
-        # add to dest
-        dst.add_cards(moved_cards)
-        # record undo
-        self.undo_stack.append(Move(src, dst, moved_cards))
+    def try_move(self, move: rules.Move) -> bool:
+        if not rules.is_legal(self.state, move):
+            return False
+        self.undo_stack.append(self.state)
+        self.state = rules.apply_move(self.state, move)
+        self.sync()
+        return True
 
     def auto_move_to_foundation(self, card: Card, src: Pile) -> bool:
         if not card:
             return False
-        for fo in self.foundations:
-            if fo.can_add([card]):
-                # move single card to this foundation
-                if isinstance(src, Tableau):
-                    # find card index (must be topmost selected)
-                    if src.cards and src.cards[-1] is card:
-                        src.remove_cards(1)
-                        fo.add_cards([card])
-                        self.undo_stack.append(Move(src, fo, [card]))
-                        return True
-                elif isinstance(src, FreeCell):
-                    if src.cards and src.cards[-1] is card:
-                        src.remove_cards(1)
-                        fo.add_cards([card])
-                        self.undo_stack.append(Move(src, fo, [card]))
-                        return True
-        return False
+        return self.try_move(rules.Move(src.loc, rules.FOUNDATION, 1, card.code))
 
     def try_double_click(self, x, y):
         pile = self.pile_at_point(x, y)
@@ -548,12 +498,8 @@ class Game:
     def undo(self):
         if not self.undo_stack:
             return
-        last = self.undo_stack.pop()
-        # remove from dst
-        n = len(last.cards)
-        last.dst.cards = last.dst.cards[:-n]
-        # add back to src
-        last.src.cards.extend(last.cards)
+        self.state = self.undo_stack.pop()
+        self.sync()
 
 
 # --- Main loop ---
@@ -571,6 +517,8 @@ def main():
                     game.new_deal()
                 elif event.key == pygame.K_u or (event.key == pygame.K_z and (pygame.key.get_mods() & pygame.KMOD_CTRL)):
                     game.undo()
+                elif event.key == pygame.K_h:
+                    game.show_hint()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 now = pygame.time.get_ticks()
                 if now - game.last_click_time < 300:  # double click
@@ -582,6 +530,7 @@ def main():
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 game.finish_drag(*event.pos)
 
+        game.poll_hint()
         game.draw()
         pygame.display.flip()
 
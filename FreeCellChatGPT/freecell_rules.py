@@ -0,0 +1,233 @@
+import random
+from typing import List, NamedTuple, Optional, Tuple
+
+# ----------------------------
+# FreeCell rules without pygame
+#  - Cards are ints: suit * 13 + rank (rank 0 = A ... 12 = K)
+#  - Tableau columns are bytes (bottom card first), free cells a tuple of
+#    cards or EMPTY, foundations a tuple with the number of cards home per suit
+#  - States are immutable and hashable; moves are applied by building a new
+#    state, and undone by applying the reverse move
+# Nothing here opens a window, so deals can be analysed and solved headless.
+# ----------------------------
+
+# --- Suits & Ranks ---
+SUITS = ("♠", "♥", "♦", "♣")
+RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+RED_SUITS = (1, 2)
+
+NUM_COLUMNS = 8
+NUM_CELLS = 4
+NUM_CARDS = 52
+EMPTY = -1
+
+# --- Locations ---
+# Moves address piles by a single int: 0-7 tableau columns, 8-11 free cells
+# and FOUNDATION for the foundation of the moved card's suit.
+CELL_BASE = NUM_COLUMNS
+FOUNDATION = CELL_BASE + NUM_CELLS
+
+# Per-card lookup tables; cheaper than divmod in the move generator
+SUIT_OF = tuple(c // 13 for c in range(NUM_CARDS))
+RANK_OF = tuple(c % 13 for c in range(NUM_CARDS))
+IS_RED = tuple(SUIT_OF[c] in RED_SUITS for c in range(NUM_CARDS))
+
+
+def make_card(suit: int, rank: int) -> int:
+    return suit * 13 + rank
+
+
+def card_name(card: int) -> str:
+    return f"{RANKS[RANK_OF[card]]}{SUITS[SUIT_OF[card]]}"
+
+
+def can_stack(card: int, onto: int) -> bool:
+    """Can 'card' go on top of 'onto' in the tableau (alternating colors, descending by 1)?"""
+    return IS_RED[card] != IS_RED[onto] and RANK_OF[card] + 1 == RANK_OF[onto]
+
+
+# --- Data Model ---
+class State(NamedTuple):
+    columns: Tuple[bytes, ...]
+    cells: Tuple[int, ...]
+    foundations: Tuple[int, ...]
+
+
+class Move(NamedTuple):
+    """Move the top n cards of src to dst; card is the first (deepest) card moved."""
+    src: int
+    dst: int
+    n: int
+    card: int
+
+
+def _replace(t: tuple, i: int, value) -> tuple:
+    return t[:i] + (value,) + t[i + 1:]
+
+
+def initial_state(deck: List[int]) -> State:
+    """Deal a 52-card deck to 8 columns: first 4 get 7, last 4 get 6."""
+    columns = tuple(bytes(deck[col::NUM_COLUMNS]) for col in range(NUM_COLUMNS))
+    return State(columns, (EMPTY,) * NUM_CELLS, (0,) * len(SUITS))
+
+
+def deal(rng: Optional[random.Random] = None) -> State:
+    deck = list(range(NUM_CARDS))
+    (rng or random).shuffle(deck)
+    return initial_state(deck)
+
+
+def is_won(state: State) -> bool:
+    return sum(state.foundations) == NUM_CARDS
+
+
+def cards_home(state: State) -> int:
+    return sum(state.foundations)
+
+
+def foundation_top(state: State, suit: int) -> Optional[int]:
+    n = state.foundations[suit]
+    return make_card(suit, n - 1) if n else None
+
+
+def run_length(column: bytes) -> int:
+    """Number of cards at the top of a column forming a descending alternating sequence."""
+    n = len(column)
+    if n == 0:
+        return 0
+    k = 1
+    while k < n and can_stack(column[n - k], column[n - k - 1]):
+        k += 1
+    return k
+
+
+def max_movable_sequence_len(state: State, dst: Optional[int] = None) -> int:
+    """
+    Movement capacity per the game's simplified rule:
+      N = empty free cells + empty tableau columns (excluding the destination column) + 1
+    """
+    empty_cells = state.cells.count(EMPTY)
+    empty_columns = sum(1 for i, col in enumerate(state.columns) if not col and i != dst)
+    return empty_cells + empty_columns + 1
+
+
+# --- Moves ---
+def is_legal(state: State, move: Move) -> bool:
+    src, dst, n, card = move
+    if src == dst or n < 1:
+        return False
+
+    # What is being moved?
+    if src < CELL_BASE:
+        col = state.columns[src]
+        if n > len(col) or col[-n] != card or run_length(col) < n:
+            return False
+    elif src < FOUNDATION:
+        if n != 1 or state.cells[src - CELL_BASE] != card or card == EMPTY:
+            return False
+    else:
+        return False  # cards are not taken back off the foundations
+
+    # Can the destination take it?
+    if dst < CELL_BASE:
+        target = state.columns[dst]
+        if target and not can_stack(card, target[-1]):
+            return False
+        return n <= max_movable_sequence_len(state, dst)
+    if dst < FOUNDATION:
+        return n == 1 and state.cells[dst - CELL_BASE] == EMPTY
+    if dst == FOUNDATION:
+        return n == 1 and RANK_OF[card] == state.foundations[SUIT_OF[card]]
+    return False
+
+
+def legal_moves(state: State) -> List[Move]:
+    """All legal moves; interchangeable targets (empty cells, empty columns) appear once."""
+    columns, cells, found = state
+    moves: List[Move] = []
+    empty_cells = cells.count(EMPTY)
+    free_cell = cells.index(EMPTY) + CELL_BASE if empty_cells else -1
+    empty_cols = [i for i, col in enumerate(columns) if not col]
+    free_col = empty_cols[0] if empty_cols else -1
+    # Capacity into a non-empty column / into an empty one
+    cap = empty_cells + len(empty_cols) + 1
+    cap_empty = cap - 1
+
+    # From free cells
+    for i, card in enumerate(cells):
+        if card == EMPTY:
+            continue
+        src = CELL_BASE + i
+        if RANK_OF[card] == found[SUIT_OF[card]]:
+            moves.append(Move(src, FOUNDATION, 1, card))
+        for d, target in enumerate(columns):
+            if target and can_stack(card, target[-1]):
+                moves.append(Move(src, d, 1, card))
+        if free_col >= 0:
+            moves.append(Move(src, free_col, 1, card))
+
+    # From tableau columns
+    for s, col in enumerate(columns):
+        if not col:
+            continue
+        top = col[-1]
+        if RANK_OF[top] == found[SUIT_OF[top]]:
+            moves.append(Move(s, FOUNDATION, 1, top))
+        run = run_length(col)
+        for d, target in enumerate(columns):
+            if d == s or not target:
+                continue
+            # Only one run length can land on a given card
+            k = RANK_OF[target[-1]] - RANK_OF[top]
+            if 1 <= k <= run and k <= cap and IS_RED[col[-k]] != IS_RED[target[-1]]:
+                moves.append(Move(s, d, k, col[-k]))
+        if free_col >= 0:
+            for k in range(1, min(run, cap_empty) + 1):
+                moves.append(Move(s, free_col, k, col[-k]))
+        if free_cell >= 0:
+            moves.append(Move(s, free_cell, 1, top))
+    return moves
+
+
+def apply_move(state: State, move: Move) -> State:
+    """Return the state after 'move'. The move is not validated; see is_legal."""
+    columns, cells, found = state
+    src, dst, n, card = move
+
+    if src < CELL_BASE:
+        col = columns[src]
+        moved = col[-n:]
+        columns = _replace(columns, src, col[:-n])
+    elif src < FOUNDATION:
+        moved = bytes((card,))
+        cells = _replace(cells, src - CELL_BASE, EMPTY)
+    else:
+        moved = bytes((card,))
+        suit = SUIT_OF[card]
+        found = _replace(found, suit, found[suit] - 1)
+
+    if dst < CELL_BASE:
+        columns = _replace(columns, dst, columns[dst] + moved)
+    elif dst < FOUNDATION:
+        cells = _replace(cells, dst - CELL_BASE, card)
+    else:
+        suit = SUIT_OF[card]
+        found = _replace(found, suit, found[suit] + 1)
+    return State(columns, cells, found)
+
+
+def undo_move(state: State, move: Move) -> State:
+    """Return the state before 'move' was applied."""
+    return apply_move(state, Move(move.dst, move.src, move.n, move.card))
+
+
+def format_state(state: State) -> str:
+    """Plain-text dump of a state, for debugging and batch tools."""
+    cells = " ".join(card_name(c) if c != EMPTY else "--" for c in state.cells)
+    found = " ".join(
+        card_name(make_card(s, n - 1)) if n else "--" for s, n in enumerate(state.foundations)
+    )
+    lines = [f"cells: {cells}   foundations: {found}"]
+    for i, col in enumerate(state.columns):
+        lines.append(f"{i + 1}: " + " ".join(card_name(c) for c in col))
+    return "\n".join(lines)
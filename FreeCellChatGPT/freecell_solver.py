@@ -0,0 +1,245 @@
+import heapq
+import random
+import sys
+import time
+from itertools import count
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import freecell_rules as rules
+from freecell_rules import CELL_BASE, EMPTY, FOUNDATION, IS_RED, NUM_CARDS, NUM_CELLS, RANK_OF, SUIT_OF, Move, State
+
+# ----------------------------
+# FreeCell solver
+#  - Weighted best-first search (f = g + weight * h) over freecell_rules states
+#  - Heuristic: cards not yet home, plus cards blocking lower cards in their
+#    column, adjusted for free cells in use and empty columns
+#  - States are hashed canonically (Zobrist), so free-cell order and column
+#    order don't matter; equal hashes share one transposition table entry
+#  - Safe cards are moved to the foundations automatically after every move
+# Usage: python freecell_solver.py [first_seed] [deals]
+# ----------------------------
+
+DEFAULT_MAX_NODES = 200_000
+DEFAULT_WEIGHT = 3.0
+
+# --- Zobrist keys ---
+# A column card is keyed by itself and the card under it (BOTTOM for the
+# bottom card). These pairs describe the columns without saying which column
+# is which. Cards not in a column or free cell are home, so the foundations
+# need no keys.
+BOTTOM = NUM_CARDS
+_rng = random.Random(0x5EED)
+COLUMN_KEYS = [[_rng.getrandbits(64) for _ in range(NUM_CARDS + 1)] for _ in range(NUM_CARDS)]
+CELL_KEYS = [_rng.getrandbits(64) for _ in range(NUM_CARDS)]
+del _rng
+
+
+def zobrist_hash(state: State) -> int:
+    h = 0
+    for col in state.columns:
+        below = BOTTOM
+        for card in col:
+            h ^= COLUMN_KEYS[card][below]
+            below = card
+    for card in state.cells:
+        if card != EMPTY:
+            h ^= CELL_KEYS[card]
+    return h
+
+
+def hash_after(h: int, state: State, move: Move) -> int:
+    """Hash of apply_move(state, move), given h = hash of state."""
+    src, dst, n, card = move
+    # Only the deepest moved card changes what lies under it
+    if src < CELL_BASE:
+        col = state.columns[src]
+        h ^= COLUMN_KEYS[card][col[-n - 1] if len(col) > n else BOTTOM]
+    elif src < FOUNDATION:
+        h ^= CELL_KEYS[card]
+    if dst < CELL_BASE:
+        target = state.columns[dst]
+        h ^= COLUMN_KEYS[card][target[-1] if target else BOTTOM]
+    elif dst < FOUNDATION:
+        h ^= CELL_KEYS[card]
+    return h
+
+
+# --- Safe moves ---
+OPPOSITE_SUITS = tuple(
+    tuple(s for s in range(len(rules.SUITS)) if (s in rules.RED_SUITS) != IS_RED[c]) for c in range(NUM_CARDS)
+)
+
+
+def is_safe_to_foundation(state: State, card: int) -> bool:
+    """A card can go home without ever being needed in the tableau again:
+    aces and twos always, otherwise once both opposite-color cards one rank
+    lower are home."""
+    found = state.foundations
+    rank = RANK_OF[card]
+    if rank != found[SUIT_OF[card]]:
+        return False
+    if rank <= 1:
+        return True
+    a, b = OPPOSITE_SUITS[card]
+    return found[a] >= rank and found[b] >= rank
+
+
+def autoplay(state: State, h: int) -> Tuple[State, int, List[Move]]:
+    """Move safe cards from column tops and free cells home until none are left."""
+    moves: List[Move] = []
+    progress = True
+    while progress:
+        progress = False
+        for i, card in enumerate(state.cells):
+            if card != EMPTY and is_safe_to_foundation(state, card):
+                move = Move(CELL_BASE + i, FOUNDATION, 1, card)
+                h = hash_after(h, state, move)
+                state = rules.apply_move(state, move)
+                moves.append(move)
+                progress = True
+        for i, col in enumerate(state.columns):
+            while col and is_safe_to_foundation(state, col[-1]):
+                move = Move(i, FOUNDATION, 1, col[-1])
+                h = hash_after(h, state, move)
+                state = rules.apply_move(state, move)
+                moves.append(move)
+                col = state.columns[i]
+                progress = True
+    return state, h, moves
+
+
+# --- Heuristic ---
+def heuristic(state: State) -> int:
+    """Cards not home, plus cards sitting above a lower card in their column
+    (each must move at least once more), plus a little for every occupied free
+    cell and a bonus for every empty column."""
+    columns, cells, found = state
+    h = NUM_CARDS - sum(found) + NUM_CELLS - cells.count(EMPTY)
+    for col in columns:
+        if not col:
+            h -= 2
+            continue
+        low = NUM_CARDS
+        for card in col:
+            rank = RANK_OF[card]
+            if rank > low:
+                h += 1
+            else:
+                low = rank
+    return h
+
+
+# --- Search ---
+class SolveResult(NamedTuple):
+    solvable: Optional[bool]  # None when the budget ran out first
+    moves: List[Move]  # shortest solution found, including automatic moves
+    nodes: int
+    seconds: float
+
+
+def _path(node) -> List[Move]:
+    moves: List[Move] = []
+    while node is not None:
+        step, node = node
+        moves[:0] = step
+    return moves
+
+
+def solve(
+    state: State,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    time_limit: Optional[float] = None,
+    weight: float = DEFAULT_WEIGHT,
+    optimize: bool = False,
+) -> SolveResult:
+    """
+    Search for a solution from 'state'.
+    Stops at the first solution unless 'optimize' is set. In that case it
+    keeps searching for shorter ones until the queue empties or the budget
+    runs out. A solution is proven shortest only if the queue empties.
+    The weight trades solution length (1.0) for speed (higher).
+    Unsolvable is reported only when the whole reachable space was searched.
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit is not None else None
+
+    h = zobrist_hash(state)
+    state, h, first = autoplay(state, h)
+    best: Optional[List[Move]] = first if rules.is_won(state) else None
+    # transposition table: canonical hash -> fewest moves it was reached in
+    seen: Dict[int, int] = {h: len(first)}
+    tie = count()
+    # heap entries: (f, tiebreak, g, state, hash, path node)
+    heap = [(0.0, next(tie), len(first), state, h, (first, None))]
+    nodes = 0
+
+    while heap and (best is None or optimize):
+        _, _, g, state, h, node = heapq.heappop(heap)
+        if seen.get(h, g) < g:
+            continue  # reached more cheaply since this entry was queued
+        nodes += 1
+        if nodes > max_nodes or (deadline is not None and nodes & 255 == 0 and time.perf_counter() > deadline):
+            return SolveResult(True if best else None, best or [], nodes, time.perf_counter() - start)
+
+        for move in rules.legal_moves(state):
+            nh = hash_after(h, state, move)
+            child = rules.apply_move(state, move)
+            # States on the queue have no safe cards left; only a card going
+            # home or a newly exposed column top can change that
+            exposed = child.columns[move.src] if move.src < CELL_BASE else None
+            if move.dst == FOUNDATION or (exposed and is_safe_to_foundation(child, exposed[-1])):
+                child, nh, auto = autoplay(child, nh)
+            else:
+                auto = []
+            ng = g + 1 + len(auto)
+            if best is not None and ng + NUM_CARDS - sum(child.foundations) >= len(best):
+                continue  # can't beat the solution already found
+            if seen.get(nh, ng + 1) <= ng:
+                continue
+            seen[nh] = ng
+            step = [move] + auto
+            if rules.is_won(child):
+                best = _path((step, node))
+                if not optimize:
+                    break
+                continue
+            heapq.heappush(heap, (ng + weight * heuristic(child), next(tie), ng, child, nh, (step, node)))
+
+    return SolveResult(best is not None, best or [], nodes, time.perf_counter() - start)
+
+
+def hint(state: State, max_nodes: int = DEFAULT_MAX_NODES, time_limit: Optional[float] = 1.0) -> Optional[Move]:
+    """First move of a solution from 'state', or None if none was found."""
+    result = solve(state, max_nodes=max_nodes, time_limit=time_limit)
+    return result.moves[0] if result.moves else None
+
+
+def describe_move(move: Move) -> str:
+    cards = rules.card_name(move.card) + (f" (+{move.n - 1})" if move.n > 1 else "")
+    return f"{cards}: {location_name(move.src)} -> {location_name(move.dst)}"
+
+
+def location_name(loc: int) -> str:
+    if loc < CELL_BASE:
+        return f"column {loc + 1}"
+    if loc < FOUNDATION:
+        return f"free cell {loc - CELL_BASE + 1}"
+    return "foundation"
+
+
+def main():
+    # Batch run over seeded deals: python freecell_solver.py [first_seed] [deals]
+    first = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    deals = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    times = []
+    for seed in range(first, first + deals):
+        result = solve(rules.deal(random.Random(seed)))
+        times.append(result.seconds)
+        status = {True: "solved", False: "unsolvable", None: "unknown"}[result.solvable]
+        print(f"deal {seed}: {status} in {len(result.moves)} moves, {result.nodes} nodes, {result.seconds:.3f}s")
+    times.sort()
+    print(f"median {times[len(times) // 2]:.3f}s, max {times[-1]:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
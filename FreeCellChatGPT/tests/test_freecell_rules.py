@@ -0,0 +1,47 @@
+import random
+
+import freecell_rules as rules
+from freecell_rules import CELL_BASE, EMPTY, FOUNDATION, Move
+
+
+def test_deal_is_seeded_and_complete():
+    state = rules.deal(random.Random(7))
+    assert state == rules.deal(random.Random(7))
+    assert [len(col) for col in state.columns] == [7, 7, 7, 7, 6, 6, 6, 6]
+    assert sorted(card for col in state.columns for card in col) == list(range(rules.NUM_CARDS))
+    assert state.cells == (EMPTY,) * rules.NUM_CELLS
+    assert rules.cards_home(state) == 0
+
+
+def test_legal_moves_apply_and_undo_round_trip():
+    for seed in range(1, 6):
+        rng = random.Random(seed)
+        state = rules.deal(rng)
+        history = []
+        for _ in range(200):
+            moves = rules.legal_moves(state)
+            if not moves:
+                break
+            for move in moves:
+                assert rules.is_legal(state, move)
+                assert rules.undo_move(rules.apply_move(state, move), move) == state
+            move = rng.choice(moves)
+            history.append((state, move))
+            state = rules.apply_move(state, move)
+            # no card is lost or duplicated
+            in_play = [c for col in state.columns for c in col] + [c for c in state.cells if c != EMPTY]
+            assert len(set(in_play)) == len(in_play) == rules.NUM_CARDS - rules.cards_home(state)
+        # undoing the whole playout returns to the deal
+        for before, move in reversed(history):
+            state = rules.undo_move(state, move)
+            assert state == before
+
+
+def test_illegal_moves_are_rejected():
+    state = rules.deal(random.Random(3))
+    top = state.columns[0][-1]
+    assert not rules.is_legal(state, Move(0, 0, 1, top))
+    assert not rules.is_legal(state, Move(0, CELL_BASE, 2, state.columns[0][-2]))
+    assert not rules.is_legal(state, Move(CELL_BASE, 1, 1, top))
+    assert not rules.is_legal(state, Move(FOUNDATION, 0, 1, top))
+    assert rules.is_legal(state, Move(0, CELL_BASE, 1, top))
@@ -0,0 +1,62 @@
+import os
+import random
+import time
+
+import freecell_rules as rules
+import freecell_solver as solver
+
+
+def replay(state, moves):
+    for move in moves:
+        assert rules.is_legal(state, move), solver.describe_move(move)
+        state = rules.apply_move(state, move)
+    return state
+
+
+def test_seeded_deals_are_solved_and_replay_legally():
+    for seed in range(1, 11):
+        deal = rules.deal(random.Random(seed))
+        result = solver.solve(deal)
+        assert result.solvable is True, f"deal {seed}"
+        assert rules.is_won(replay(deal, result.moves)), f"deal {seed}"
+
+
+def test_hint_is_first_move_of_a_solution():
+    deal = rules.deal(random.Random(4))
+    move = solver.hint(deal)
+    assert rules.is_legal(deal, move)
+    assert solver.solve(rules.apply_move(deal, move)).solvable is True
+
+
+def test_solved_state_needs_no_moves():
+    won = rules.State((b"",) * rules.NUM_COLUMNS, (rules.EMPTY,) * rules.NUM_CELLS, (13,) * len(rules.SUITS))
+    result = solver.solve(won)
+    assert result.solvable is True
+    assert result.moves == []
+
+
+def test_game_hint_searches_off_the_ui_thread(monkeypatch):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import freecell2
+
+    real_solve = solver.solve
+
+    def slow_solve(state, **kwargs):
+        time.sleep(0.2)
+        return real_solve(state, **kwargs)
+
+    monkeypatch.setattr(solver, "solve", slow_solve)
+    game = freecell2.Game()
+    game.state = rules.deal(random.Random(4))
+    game.sync()
+
+    start = time.perf_counter()
+    game.show_hint()
+    assert time.perf_counter() - start < 0.1
+    assert game.hint is None and game.message == "Thinking..."
+
+    game.hint_worker.join(timeout=5)
+    game.poll_hint()
+    assert rules.is_legal(game.state, game.hint)
+    assert game.message.startswith("Hint: ")
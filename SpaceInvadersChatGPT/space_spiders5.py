@@ -4,24 +4,36 @@
 #
 # Controls: Left/Right (A/D) to move, Space / Up / W to shoot.
 # Game Over: Press Y/Enter to play again or N/Esc to quit.
+#
+# Soak run: python space_spiders5.py --soak 3600 [--fast] [--seed N]
+# (autopilot plays every level with an invulnerable tank; prints memory,
+# list sizes and frame time per level).
+# Stress run: python space_spiders5.py --stress 30 --rows 50 --cols 100
+# --max-bullets 50 [--fast] [--headless] (frame-time percentiles and
+# per-subsystem costs).
 
 import os
 import sys
 import math
+import queue
 import random
+import tempfile
 import threading
 import time
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 import pygame
 
 # ------------------ Config ------------------
 SCREEN_W, SCREEN_H = 900, 700
 FPS = 60
+SIM_DT = 1.0 / FPS                # simulated seconds per update
 
 # Formation layout baseline
 START_ROWS, START_COLS = 4, 8
+MAX_COLS = 14
 CELL_W, CELL_H = 70, 50
 INVADER_Y_OFFSET = 80
 INVADER_STEP_DOWN = 22
@@ -41,6 +53,8 @@ BULLETS_PER_LEVEL = 170
 MAX_LEVELS = 12
 SCORE_PER_INVADER = 10
 SCORE_PER_BOMB = 3
+HIGH_SCORE_SAVE_DELAY = 2.0       # seconds of quiet before a new high score is written
+INVULNERABLE_CLEARANCE = 40       # px an invulnerable (soak) tank keeps between it and the formation
 
 # Colors
 BLACK = (0,0,0)
@@ -128,11 +142,71 @@ class Bomb:
     rect: pygame.Rect
     active: bool = True
 
-@dataclass
-class Invader:
-    x: float
-    y: float
-    alive: bool = True
+class Formation:
+    # Invader i sits at row i // cols, column i % cols. Positions and alive
+    # flags live in NumPy arrays so moves and collision tests are vectorized.
+    # The whole grid moves together, so every column (and row) shares one x
+    # (y); per-column/row alive counts keep the outermost live column and
+    # the lowest live row current as invaders die.
+    def __init__(self, rows, cols, start_x, w, h):
+        self.rows, self.cols = rows, cols
+        self.w, self.h = w, h
+        c = np.tile(np.arange(cols), rows)
+        r = np.repeat(np.arange(rows), cols)
+        self.x = (start_x + c*CELL_W).astype(np.float64)
+        self.y = (INVADER_Y_OFFSET + r*CELL_H).astype(np.float64)
+        self.alive = np.ones(rows*cols, dtype=bool)
+        self.total = self.count = rows*cols
+        self.col_alive = np.full(cols, rows)
+        self.row_alive = np.full(rows, cols)
+        self.left_col, self.right_col = 0, cols - 1
+        self.low_row = rows - 1
+
+    def kill(self, i):
+        self.alive[i] = False
+        self.count -= 1
+        r, c = divmod(int(i), self.cols)
+        self.col_alive[c] -= 1
+        self.row_alive[r] -= 1
+        if self.count == 0:
+            return
+        while self.col_alive[self.left_col] == 0:
+            self.left_col += 1
+        while self.col_alive[self.right_col] == 0:
+            self.right_col -= 1
+        while self.row_alive[self.low_row] == 0:
+            self.low_row -= 1
+
+    def min_x(self):
+        return self.x[self.left_col]
+
+    def max_x(self):
+        return self.x[self.right_col] + self.w
+
+    def bottom(self):
+        return self.y[self.low_row*self.cols] + self.h
+
+    def move(self, dx, dy=0.0):
+        # Dead entries move too; they're masked out everywhere else
+        self.x += dx
+        if dy:
+            self.y += dy
+
+    def hits(self, left, top, right, bottom):
+        # AABB test of every live invader against rects given as arrays
+        # (one row per rect), matching pygame.Rect.colliderect on the
+        # integer-truncated invader positions
+        ix = self.x.astype(np.int64)
+        iy = self.y.astype(np.int64)
+        return (self.alive
+                & (left[:, None] < ix + self.w) & (ix < right[:, None])
+                & (top[:, None] < iy + self.h) & (iy < bottom[:, None]))
+
+    def draw(self, screen, surf):
+        idx = np.flatnonzero(self.alive)
+        xs = self.x[idx].astype(np.int64).tolist()
+        ys = self.y[idx].astype(np.int64).tolist()
+        screen.blits([(surf, pos) for pos in zip(xs, ys)], doreturn=False)
 
 class Player:
     def __init__(self, x, y, surf):
@@ -148,20 +222,30 @@ class Player:
         screen.blit(self.surf, self.rect.topleft)
 
 # ------------------ Sound Manager (threaded) ------------------
+SOUND_NAMES = ("shoot", "hit", "boom")
+
 class SoundManager:
+    # Requests made during a frame are collected (duplicates dropped) and
+    # handed to the player thread as one batch by flush(). The thread blocks
+    # on the queue, so it uses no CPU while nothing is playing. Each sound has
+    # a reserved mixer channel, so a burst of shots can't take the channel a
+    # hit or explosion needs.
     def __init__(self):
+        self.mixer_ok = True
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=256)
         except pygame.error:
             # Fallback without sound if device unavailable
-            pass
+            self.mixer_ok = False
         base = os.path.dirname(os.path.abspath(__file__))
-        self.snd_shoot = self._load_sound(os.path.join(base, "shoot.wav"))
-        self.snd_hit = self._load_sound(os.path.join(base, "hit.wav"))
-        self.snd_boom = self._load_sound(os.path.join(base, "boom.wav"))
-        self.lock = threading.Lock()
-        self.queue = []
-        self.alive = True
+        self.sounds = {name: self._load_sound(os.path.join(base, name + ".wav")) for name in SOUND_NAMES}
+        self.channels = {}
+        if self.mixer_ok:
+            pygame.mixer.set_reserved(len(SOUND_NAMES))
+            for i, name in enumerate(SOUND_NAMES):
+                self.channels[name] = pygame.mixer.Channel(i)
+        self.pending = []
+        self.queue = queue.SimpleQueue()
         self.thread = threading.Thread(target=self._runner, daemon=True)
         self.thread.start()
 
@@ -174,53 +258,150 @@ class SoundManager:
             return Null()
 
     def _runner(self):
-        while self.alive:
-            item = None
-            with self.lock:
-                if self.queue:
-                    item = self.queue.pop(0)
-            if item:
-                try: item.play()
-                except Exception: pass
-            else:
-                time.sleep(0.004)
-
-    def play_shoot(self):
-        with self.lock: self.queue.append(self.snd_shoot)
-    def play_hit(self):
-        with self.lock: self.queue.append(self.snd_hit)
-    def play_boom(self):
-        with self.lock: self.queue.append(self.snd_boom)
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            for name in batch:
+                try:
+                    channel = self.channels.get(name)
+                    if channel is not None:
+                        channel.play(self.sounds[name])
+                    else:
+                        self.sounds[name].play()
+                except Exception:
+                    pass
+
+    def _request(self, name):
+        if name not in self.pending:
+            self.pending.append(name)
+
+    def play_shoot(self): self._request("shoot")
+    def play_hit(self): self._request("hit")
+    def play_boom(self): self._request("boom")
+
+    def flush(self):
+        # Called once per frame from the main loop
+        if self.pending:
+            self.queue.put(tuple(self.pending))
+            self.pending.clear()
 
     def stop(self):
-        self.alive = False
+        self.queue.put(None)
         try: self.thread.join(timeout=0.2)
         except Exception: pass
 
-# ------------------ Bomb Scheduler (threaded) ------------------
-class BombScheduler:
-    def __init__(self, invaders: List[Invader], bombs: List[Bomb], stop_flag: threading.Event, spider_w: int):
-        self.invaders = invaders
-        self.bombs = bombs
-        self.flag = stop_flag
-        self.spider_w = spider_w
+# ------------------ High Score Writer (threaded) ------------------
+class HighScoreWriter:
+    # submit() only records the latest score; the thread writes it once no
+    # new score has arrived for `delay` seconds, so a scoring streak costs one
+    # write. Files are replaced atomically via a temp file in the same dir.
+    def __init__(self, path: Optional[str], delay: float = HIGH_SCORE_SAVE_DELAY):
+        self.path = path  # None disables writing
+        self.delay = delay
+        self.cond = threading.Condition()
+        self.pending = None
+        self.due = 0.0
+        self.writing = False
+        self.alive = True
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
+    def submit(self, score: int):
+        with self.cond:
+            self.pending = int(score)
+            self.due = time.monotonic() + self.delay
+            self.cond.notify_all()
+
+    def flush(self, wait: bool = False):
+        # Make any pending score due now; optionally block until it's on disk
+        with self.cond:
+            self.due = 0.0
+            self.cond.notify_all()
+            while wait and (self.pending is not None or self.writing) and self.thread.is_alive():
+                self.cond.wait(0.1)
+
+    def close(self):
+        self.flush(wait=True)
+        with self.cond:
+            self.alive = False
+            self.cond.notify_all()
+        self.thread.join(timeout=1.0)
+
     def _run(self):
-        while not self.flag.is_set():
-            alive = [i for i in self.invaders if i.alive]
-            if alive:
-                inv = random.choice(alive)
-                r = pygame.Rect(int(inv.x)+self.spider_w//2-3, int(inv.y)+10, 6, 10)
-                self.bombs.append(Bomb(r))
-            time.sleep(random.uniform(*INVADER_BOMB_INTERVAL))
+        with self.cond:
+            while True:
+                if self.pending is None:
+                    if not self.alive:
+                        return
+                    self.cond.wait()
+                    continue
+                remaining = self.due - time.monotonic()
+                if remaining > 0:
+                    self.cond.wait(remaining)
+                    continue
+                score, self.pending = self.pending, None
+                self.writing = True
+                self.cond.release()
+                try:
+                    self._write(score)
+                finally:
+                    self.cond.acquire()
+                    self.writing = False
+                    self.cond.notify_all()
+
+    def _write(self, score: int):
+        if self.path is None:
+            return
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".highscore-", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(str(score))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            tmp = None
+        except Exception:
+            pass
+        finally:
+            if tmp is not None:
+                try: os.remove(tmp)
+                except OSError: pass
+
+# ------------------ Bomb Scheduler (game clock) ------------------
+class BombScheduler:
+    # Bombs fall on simulation time, so they pause with the game and a seeded
+    # RNG replays the same drops. Until the next drop is due a poll is one
+    # comparison.
+    def __init__(self, formation: Formation, rng: random.Random, spider_w: int, now: float):
+        self.formation = formation
+        self.rng = rng
+        self.spider_w = spider_w
+        self.next_drop = now  # first bomb as soon as the level starts
+
+    def poll(self, now: float) -> Optional[Bomb]:
+        if now < self.next_drop:
+            return None
+        self.next_drop = now + self.rng.uniform(*INVADER_BOMB_INTERVAL)
+        f = self.formation
+        if f.count == 0:
+            return None
+        i = self.rng.choice(np.flatnonzero(f.alive))
+        r = pygame.Rect(int(f.x[i])+self.spider_w//2-3, int(f.y[i])+10, 6, 10)
+        return Bomb(r)
 
 # ------------------ Game ------------------
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, seed=None, save_high_score=True, invulnerable=False):
         self.screen = screen
+        # Soak runs only: bombs don't end the game and the formation stops
+        # descending just above the tank, so every level is played to the end
+        self.invulnerable = invulnerable
+        self.hits_taken = 0  # bombs that hit the tank, fatal or not
         self.clock = pygame.time.Clock()
+        self.rng = random.Random(seed)
+        self.sim_time = 0.0  # seconds of gameplay simulated so far
         self.font = pygame.font.SysFont("Consolas", 22)
         self.bigfont = pygame.font.SysFont("Consolas", 48, bold=True)
         self.smallfont = pygame.font.SysFont("Consolas", 18)
@@ -230,6 +411,7 @@ class Game:
         self.hs_path = os.path.join(base, "highscore.txt")
         self.high_score = 0
         self._load_high_score()
+        self.hs_writer = HighScoreWriter(self.hs_path if save_high_score else None)
         self.high_beaten = False
         self.congrats_timer = 0
 
@@ -256,11 +438,8 @@ class Game:
             self.high_score = 0
 
     def _save_high_score(self):
-        try:
-            with open(self.hs_path, "w") as f:
-                f.write(str(int(self.high_score)))
-        except Exception:
-            pass
+        # Never touches the file here; the writer thread does, debounced
+        self.hs_writer.submit(self.high_score)
 
     # ---------- Game State ----------
     def reset_whole_game(self):
@@ -273,19 +452,13 @@ class Game:
         self.game_over = False
         rows = START_ROWS + (level-1)//2
         cols = START_COLS + (level-1)
-        cols = min(cols, 14)
+        cols = min(cols, MAX_COLS)
 
-        self.invaders: List[Invader] = []
         start_x = (SCREEN_W - cols*CELL_W)//2 + CELL_W//2
-        for r in range(rows):
-            for c in range(cols):
-                x = start_x + c*CELL_W
-                y = INVADER_Y_OFFSET + r*CELL_H
-                self.invaders.append(Invader(x=float(x), y=float(y)))
+        self.formation = Formation(rows, cols, start_x, self.spider_surf.get_width(), self.spider_surf.get_height())
 
         self.inv_dir = 1  # 1 right, -1 left
         self.inv_speed_base = INVADER_BASE_SPEED + (self.level-1)*0.25
-        self.inv_rect_w = self.spider_surf.get_width()
         self.drop_cooldown = 0  # frames after a wall-drop to prevent chain drops
 
         # Player & ordnance
@@ -293,16 +466,7 @@ class Game:
         self.bullets: List[Bullet] = []
         self.bombs: List[Bomb] = []
         self.bullets_left = BULLETS_PER_LEVEL
-
-        # Threading: bombs
-        if hasattr(self, "bomb_flag"):
-            self.bomb_flag.set()
-        self.bomb_flag = threading.Event()
-        self.bomb_thread = BombScheduler(self.invaders, self.bombs, self.bomb_flag, self.spider_surf.get_width())
-
-    def shutdown_level_threads(self):
-        if hasattr(self, "bomb_flag"):
-            self.bomb_flag.set()
+        self.bomb_sched = BombScheduler(self.formation, self.rng, self.spider_surf.get_width(), self.sim_time)
 
     # ---------- Input ----------
     def handle_input(self):
@@ -316,7 +480,7 @@ class Game:
 
     def shoot(self):
         if self.bullets_left <= 0: return
-        if len([b for b in self.bullets if b.active]) >= MAX_BULLETS_AIR:
+        if sum(1 for b in self.bullets if b.active) >= MAX_BULLETS_AIR:
             return
         bx = self.player.rect.centerx - 2
         by = self.player.rect.top - 12
@@ -326,18 +490,37 @@ class Game:
         self.snd.play_shoot()
 
     # ---------- Updates ----------
+    def compact(self):
+        # Drop spent ordnance so per-frame loops only see live objects
+        self.bullets = [b for b in self.bullets if b.active]
+        self.bombs = [b for b in self.bombs if b.active]
+
+    def update(self):
+        self.sim_time += SIM_DT
+        bomb = self.bomb_sched.poll(self.sim_time)
+        if bomb is not None:
+            self.bombs.append(bomb)
+        status = self.update_invaders()
+        self.update_bullets()
+        self.update_bombs()
+        self.compact()
+        if status == "cleared":
+            self.level_cleared()
+        if self.game_over:
+            self.hs_writer.flush()
+
     def current_invader_speed(self, alive_count_ratio: float) -> float:
         # Speed increases as invaders die (rule 13)
         return self.inv_speed_base * (1 + (1 - alive_count_ratio) * 1.2)
 
     def update_invaders(self):
-        alive = [i for i in self.invaders if i.alive]
-        if not alive:
+        f = self.formation
+        if f.count == 0:
             return "cleared"
 
-        min_x = min(i.x for i in alive)
-        max_x = max(i.x for i in alive) + self.inv_rect_w
-        alive_ratio = len(alive)/len(self.invaders)
+        min_x = f.min_x()
+        max_x = f.max_x()
+        alive_ratio = f.count/f.total
         speed = self.current_invader_speed(alive_ratio)
 
         left_limit = 20
@@ -352,39 +535,32 @@ class Game:
         hit_wall_now = (will_hit_left or will_hit_right) and (self.drop_cooldown == 0)
 
         if hit_wall_now:
-            # Drop exactly one row
-            for inv in alive:
-                inv.y += INVADER_STEP_DOWN
-
-            # Tuck inside to avoid immediate re-trigger
+            # Drop exactly one row, tucked inside to avoid immediate re-trigger
             if will_hit_left:
                 shift = (left_limit - min_x) + WALL_INNER_TUCK
             else:
                 shift = (right_limit - max_x) - WALL_INNER_TUCK  # negative value
-            for inv in alive:
-                inv.x += shift
+            step = INVADER_STEP_DOWN
+            if self.invulnerable:
+                step = clamp(self.player.rect.top - INVULNERABLE_CLEARANCE - f.bottom(), 0, step)
+            f.move(shift, step)
 
             # Reverse and start cooldown
             self.inv_dir *= -1
             self.drop_cooldown = WALL_DROP_COOLDOWN_FRAMES
 
             # Ground check after drop
-            for inv in alive:
-                if inv.y + self.spider_surf.get_height() >= self.player.rect.bottom:
-                    self.game_over = True
-                    break
+            if f.bottom() >= self.player.rect.bottom:
+                self.game_over = True
         else:
             # Normal horizontal advance
-            for inv in alive:
-                inv.x += dx
-
-        # Collision with player (game over)
-        if not self.game_over:
-            for inv in alive:
-                inv_rect = self.spider_surf.get_rect(topleft=(int(inv.x), int(inv.y)))
-                if inv_rect.colliderect(self.player.rect):
-                    self.game_over = True
-                    break
+            f.move(dx)
+
+        # Collision with player (game over); only once the formation is low enough
+        p = self.player.rect
+        if not self.game_over and f.bottom() > p.top:
+            if f.hits(np.array([p.left]), np.array([p.top]), np.array([p.right]), np.array([p.bottom])).any():
+                self.game_over = True
 
         return None
 
@@ -414,24 +590,30 @@ class Game:
                     self.snd.play_boom()
                     break
 
-        # Bullet vs invader
-        for b in self.bullets:
-            if not b.active: continue
-            for inv in self.invaders:
-                if not inv.alive: continue
-                inv_rect = self.spider_surf.get_rect(topleft=(int(inv.x), int(inv.y)))
-                if b.rect.colliderect(inv_rect):
-                    inv.alive = False
-                    b.active = False
-                    self.score += SCORE_PER_INVADER
-                    if self.score > self.high_score:
-                        if not self.high_beaten:
-                            self.congrats_timer = int(4*FPS)
-                        self.high_beaten = True
-                        self.high_score = self.score
-                        self._save_high_score()
-                    self.snd.play_hit()
-                    break
+        # Bullet vs invader: all bullets against all invaders in one test.
+        # Bullets are then resolved in order against invaders still alive,
+        # so each bullet kills at most one and the first in formation order.
+        live = [b for b in self.bullets if b.active]
+        if not live:
+            return
+        f = self.formation
+        hits = f.hits(np.array([b.rect.left for b in live]), np.array([b.rect.top for b in live]),
+                      np.array([b.rect.right for b in live]), np.array([b.rect.bottom for b in live]))
+        for row in np.flatnonzero(hits.any(axis=1)):
+            b = live[row]
+            for i in np.flatnonzero(hits[row]):
+                if not f.alive[i]: continue
+                f.kill(i)
+                b.active = False
+                self.score += SCORE_PER_INVADER
+                if self.score > self.high_score:
+                    if not self.high_beaten:
+                        self.congrats_timer = int(4*FPS)
+                    self.high_beaten = True
+                    self.high_score = self.score
+                    self._save_high_score()
+                self.snd.play_hit()
+                break
 
     def update_bombs(self):
         for bomb in self.bombs:
@@ -442,7 +624,8 @@ class Game:
                 continue
             if bomb.rect.colliderect(self.player.rect):
                 bomb.active = False
-                self.game_over = True
+                self.hits_taken += 1
+                self.game_over = not self.invulnerable
                 self.snd.play_boom()
 
     # ---------- Drawing ----------
@@ -455,9 +638,7 @@ class Game:
         self.screen.fill((10,10,15))
 
         # Invaders
-        for inv in self.invaders:
-            if inv.alive:
-                self.screen.blit(self.spider_surf, (int(inv.x), int(inv.y)))
+        self.formation.draw(self.screen, self.spider_surf)
 
         # Player
         self.player.draw(self.screen)
@@ -485,7 +666,7 @@ class Game:
 
     # ---------- Level / Game transitions ----------
     def level_cleared(self):
-        self.shutdown_level_threads()
+        self.hs_writer.flush()
         self.level += 1
         if self.level > MAX_LEVELS:
             self.game_over = True
@@ -518,35 +699,313 @@ class Game:
                     if self.game_over:
                         if event.key in (pygame.K_y, pygame.K_RETURN):
                             # Replay
-                            self.shutdown_level_threads()
                             self.reset_whole_game()
                         elif event.key in (pygame.K_n, pygame.K_ESCAPE):
                             self.running = False
 
             if not self.game_over:
                 self.handle_input()
-                status = self.update_invaders()
-                self.update_bullets()
-                self.update_bombs()
-                if status == "cleared":
-                    self.level_cleared()
+                self.update()
                 self.draw()
             else:
                 self.game_over_screen()
 
+            self.snd.flush()
             self.clock.tick(FPS)
 
-        self.shutdown_level_threads()
-        self._save_high_score()
+        self.hs_writer.close()
         self.snd.stop()
 
+# ------------------ Soak / stress runs ------------------
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values)-1, int(len(sorted_values)*q))]
+
+class Autopilot:
+    # Plays for unattended runs. Among the columns with no bullet on their
+    # way it picks the soonest shot the tank can get under in time, stepping
+    # the formation with the game's own wall rule to lead it, and fires once
+    # lined up. A move that walks into a falling bomb is swapped for the one
+    # that keeps the tank clear longest.
+    LOOKAHEAD = 40      # frames of bomb fall checked for each move
+    HORIZON = 90        # frames ahead searched for a shot the tank can make
+    AIM_TOLERANCE = 8   # px inside the spider's half-width
+
+    def __init__(self, game):
+        self.game = game
+        self.targets = []  # (bullet, column it was fired at)
+
+    def step(self):
+        g = self.game
+        live = {id(b) for b in g.bullets if b.active}
+        self.targets = [(b, c) for b, c in self.targets if id(b) in live]
+        aim = self.aim()
+        toward = 0
+        if aim is not None:
+            off = aim[0] - g.player.rect.centerx
+            toward = 0 if abs(off) < PLAYER_SPEED else (1 if off > 0 else -1)
+        # max() keeps the first of equally safe moves, i.e. the preferred one
+        preferred = [toward, 0, -toward] if toward else [0, -1, 1]
+        g.player.move(max(preferred, key=self.time_to_impact))
+        if aim is not None and aim[2] and abs(aim[0] - g.player.rect.centerx) <= g.formation.w//2 - self.AIM_TOLERANCE:
+            fired = len(g.bullets)
+            g.shoot()
+            if len(g.bullets) > fired:
+                self.targets.append((g.bullets[-1], aim[1]))
+
+    def time_to_impact(self, dx):
+        # Frames until a bomb hits if the tank keeps moving by dx
+        p = self.game.player
+        rect = p.rect.copy()
+        bombs = [b.rect for b in self.game.bombs if b.active and b.rect.bottom <= rect.bottom]
+        for t in range(1, self.LOOKAHEAD + 1):
+            rect.x = clamp(p.rect.x + dx*p.speed*t, 0, SCREEN_W - rect.w)
+            fall = int(BOMB_SPEED*t)
+            for r in bombs:
+                if rect.colliderect(r.move(0, fall)):
+                    return t
+        return self.LOOKAHEAD
+
+    def aim(self):
+        # (x to line up on, column, whether to fire now), or None
+        g = self.game
+        f = g.formation
+        if f.count == 0:
+            return None
+        p = g.player.rect
+        alive = f.alive.reshape(f.rows, f.cols)
+        low = f.rows - 1 - alive[::-1].argmax(axis=0)   # lowest live row per column
+        pending = {c for _, c in self.targets}
+        by = p.top - 12  # where shoot() puts a new bullet's top
+        flights = {}
+        for c in np.flatnonzero(f.col_alive):
+            if c in pending:
+                continue
+            bottom = int(f.y[low[c]*f.cols + c]) + f.h
+            # updates until the bullet reaches the column's lowest spider
+            flights[int(c)] = max(1, (by - bottom) // int(BULLET_SPEED) + 1)
+        if not flights:
+            return None
+        travel = np.array(self.travel(max(flights.values()) + self.HORIZON))
+        # a shot fired t frames from now: the tank can move PLAYER_SPEED*t by then
+        reach = np.arange(self.HORIZON)*PLAYER_SPEED + (f.w//2 - self.AIM_TOLERANCE)
+        best = None
+        for c, frames in flights.items():
+            xs = f.x[c] + f.w/2 + travel[frames:frames + self.HORIZON]
+            ok = (np.abs(xs - p.centerx) <= reach) & (xs >= p.w/2) & (xs <= SCREEN_W - p.w/2)
+            t = int(ok.argmax()) if ok.any() else self.HORIZON - 1
+            key = (not ok.any(), t, abs(xs[t] - p.centerx))
+            if best is None or key < best[0]:
+                best = (key, xs[t], c)
+        key, x, c = best
+        return x, c, key[:2] == (False, 0)
+
+    def travel(self, frames):
+        # Formation x travel after each of the next `frames` updates,
+        # following update_invaders' wall rule (tuck, reverse, cooldown)
+        g = self.game
+        f = g.formation
+        speed = g.current_invader_speed(f.count/f.total)
+        lo, hi = f.min_x(), f.max_x()
+        direction, cooldown, moved = g.inv_dir, g.drop_cooldown, 0.0
+        out = [0.0]
+        for _ in range(frames):
+            if cooldown > 0:
+                cooldown -= 1
+            dx = speed * direction
+            hit_left = lo + moved + dx <= 20
+            hit_right = hi + moved + dx >= SCREEN_W - 20
+            if (hit_left or hit_right) and cooldown == 0:
+                if hit_left:
+                    moved += (20 - (lo + moved)) + WALL_INNER_TUCK
+                else:
+                    moved += (SCREEN_W - 20 - (hi + moved)) - WALL_INNER_TUCK
+                direction = -direction
+                cooldown = WALL_DROP_COOLDOWN_FRAMES
+            else:
+                moved += dx
+            out.append(moved)
+        return out
+
+def soak(seconds, report_every=60.0, seed=None, fast=False):
+    # Plays unattended with the Autopilot for `seconds` of game time. The
+    # tank is invulnerable (see Game), so the later levels, which outpace
+    # any player, are still played out at full size; after the last level
+    # the game starts over. An empty magazine is refilled and counted.
+    # One row is printed per level, or every `report_every` game seconds
+    # within a level: traced memory, the largest bullet/bomb lists seen,
+    # frame time, and how often the tank was hit and the magazine refilled.
+    # With fast=True frames aren't capped, so it runs faster than real time.
+    import tracemalloc
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    # Unattended scores shouldn't replace the real high score
+    game = Game(screen, seed=seed, save_high_score=False, invulnerable=True)
+    pilot = Autopilot(game)
+    tracemalloc.start()
+    frame_times = []
+    games = 1
+    hits_before = refills = 0
+    max_bullets = max_bombs = 0
+    level, level_start, last_report = game.level, 0.0, 0.0
+
+    def report():
+        frame_times.sort()
+        cur, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        print(f"{game.sim_time:8.0f}  {games:5d}  {level:5d}  {game.sim_time - level_start:7.1f}"
+              f"  {game.hits_taken - hits_before:4d}  {refills:7d}  {max_bullets:11d}  {max_bombs:9d}  {cur//1024:6d}  {peak//1024:7d}"
+              f"  {percentile(frame_times, 0.5)*1000:12.2f}  {percentile(frame_times, 0.99)*1000:12.2f}"
+              f"  {'yes' if game.level != level else 'no'}", flush=True)
+        frame_times.clear()
+
+    print("sim_s     games  level  level_s  hits  refills  max_bullets  max_bombs  mem_kb  peak_kb"
+          "  frame_p50_ms  frame_p99_ms  cleared")
+    while game.sim_time < seconds:
+        pygame.event.pump()
+        if game.bullets_left == 0:
+            game.bullets_left = BULLETS_PER_LEVEL
+            refills += 1
+        pilot.step()
+        t0 = time.perf_counter()  # time the game's frame, not the pilot
+        game.update()
+        game.draw()
+        game.snd.flush()
+        frame_times.append(time.perf_counter() - t0)
+        max_bullets = max(max_bullets, len(game.bullets))
+        max_bombs = max(max_bombs, len(game.bombs))
+        if not fast:
+            game.clock.tick(FPS)
+
+        if game.level != level or game.sim_time - last_report >= report_every:
+            report()
+            last_report = game.sim_time
+            max_bullets = max_bombs = 0
+            if game.level != level:
+                if game.level > MAX_LEVELS:
+                    game.reset_whole_game()
+                    games += 1
+                level, level_start = game.level, game.sim_time
+                hits_before, refills = game.hits_taken, 0
+    if frame_times:
+        report()
+    tracemalloc.stop()
+    game.hs_writer.close()
+    game.snd.stop()
+    pygame.quit()
+
+def stress(seconds, rows, cols, max_bullets, cell=None, seed=None, fast=False, headless=False):
+    # Fills the screen with a rows x cols formation (cells shrink to fit unless
+    # `cell` is given), sweeps and fires every frame for `seconds` of wall
+    # time, and reports frame-time percentiles plus the cost of each subsystem.
+    # Game over just restarts the level so the load stays put.
+    global START_ROWS, START_COLS, MAX_COLS, MAX_BULLETS_AIR, BULLETS_PER_LEVEL, CELL_W, CELL_H
+    START_ROWS, START_COLS, MAX_COLS = rows, cols, cols
+    MAX_BULLETS_AIR = max_bullets
+    BULLETS_PER_LEVEL = 10**9
+    if cell:
+        CELL_W, CELL_H = cell
+    else:
+        CELL_W = max(1, min(CELL_W, (SCREEN_W - 120) // cols))
+        CELL_H = max(1, min(CELL_H, (SCREEN_H//2 - INVADER_Y_OFFSET) // rows))
+
+    if headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    pygame.display.set_caption("Space Spiders (stress)")
+    game = Game(screen, seed=seed, save_high_score=False)
+
+    # Time each subsystem by wrapping the bound methods on this instance
+    costs = {name: [] for name in ("invaders", "bullets", "bombs", "draw")}
+    def timed(name, fn):
+        samples = costs[name]
+        def wrapper(*a):
+            t = time.perf_counter()
+            result = fn(*a)
+            samples.append(time.perf_counter() - t)
+            return result
+        return wrapper
+    game.update_invaders = timed("invaders", game.update_invaders)
+    game.update_bullets = timed("bullets", game.update_bullets)
+    game.update_bombs = timed("bombs", game.update_bombs)
+    game.draw = timed("draw", game.draw)
+
+    print(f"stress: {rows}x{cols} = {rows*cols} spiders, cell {CELL_W}x{CELL_H}, "
+          f"{max_bullets} bullets in the air, {'uncapped' if fast else f'{FPS} FPS cap'}")
+    frame_times = []
+    restarts = 0
+    direction = 1
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        pygame.event.pump()
+        t0 = time.perf_counter()
+        if game.game_over:
+            game.create_level(game.level)
+            restarts += 1
+        if game.player.rect.left <= 0 or game.player.rect.right >= SCREEN_W:
+            direction = -direction
+        game.player.move(direction)
+        game.shoot()
+        game.update()
+        game.draw()
+        game.snd.flush()
+        frame_times.append(time.perf_counter() - t0)
+        if not fast:
+            game.clock.tick(FPS)
+
+    frame_times.sort()
+    n = len(frame_times)
+    print(f"frames {n}  restarts {restarts}  alive {game.formation.count}  score {game.score}")
+    print("frame ms   p50 {:.2f}  p90 {:.2f}  p99 {:.2f}  max {:.2f}".format(
+        *(percentile(frame_times, q) * 1000 for q in (0.5, 0.9, 0.99)), frame_times[-1] * 1000))
+    print("subsystem    mean_ms   p99_ms  share")
+    total = sum(frame_times)
+    for name, samples in costs.items():
+        samples.sort()
+        if not samples:
+            continue
+        print(f"{name:10s} {sum(samples)/len(samples)*1000:9.3f} {percentile(samples, 0.99)*1000:8.3f}"
+              f"  {sum(samples)/total*100:4.0f}%")
+    game.hs_writer.close()
+    game.snd.stop()
+    pygame.quit()
+
 # ------------------ Entrypoint ------------------
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Space Spiders")
+    parser.add_argument("--soak", type=float, metavar="SECONDS",
+                        help="play unattended for SECONDS and report memory/frame time")
+    parser.add_argument("--report-every", type=float, default=60.0, metavar="SECONDS",
+                        help="reporting interval for --soak (default: 60)")
+    parser.add_argument("--stress", type=float, metavar="SECONDS",
+                        help="run a large auto-firing formation for SECONDS and report frame costs")
+    parser.add_argument("--rows", type=int, default=START_ROWS, help="formation rows for --stress")
+    parser.add_argument("--cols", type=int, default=START_COLS,
+                        help="formation columns for --stress (also lifts the column cap)")
+    parser.add_argument("--max-bullets", type=int, default=MAX_BULLETS_AIR,
+                        help="bullets allowed in the air for --stress")
+    parser.add_argument("--cell", type=int, nargs=2, metavar=("W", "H"),
+                        help="formation cell size for --stress (default: shrink to fit)")
+    parser.add_argument("--headless", action="store_true", help="no window for --stress")
+    parser.add_argument("--fast", action="store_true",
+                        help="don't cap the frame rate in --soak/--stress")
+    parser.add_argument("--seed", type=int, help="seed the bomb RNG for reproducible runs")
+    args = parser.parse_args()
+    if args.soak:
+        soak(args.soak, args.report_every, args.seed, args.fast)
+        return
+    if args.stress:
+        stress(args.stress, args.rows, args.cols, args.max_bullets, args.cell,
+               args.seed, args.fast, args.headless)
+        return
+
     pygame.init()
     flags = pygame.HWSURFACE | pygame.DOUBLEBUF
     screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), flags)
     pygame.display.set_caption("Space Spiders")
-    Game(screen).run()
+    Game(screen, seed=args.seed).run()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -1,38 +1,70 @@
 from __future__ import annotations
 
+from typing import Dict, Tuple
+
 import pygame
 
 from settings import WHITE
 
+# Pre-rendered alien sprites keyed by (width, height, colour)
+_sprite_cache: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def sprite_padding(w: int) -> int:
+    # Legs reach past the alien rect, so sprites carry a transparent margin
+    return w // 3
+
+
+def alien_sprite(w: int, h: int, color) -> pygame.Surface:
+    key = (w, h, tuple(color))
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        pad = sprite_padding(w)
+        sprite = pygame.Surface((w + 2 * pad, h + 2 * pad), pygame.SRCALPHA)
+        draw_spider(sprite, pad, pad, w, h, color)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def draw_spider(surface: pygame.Surface, x: int, y: int, w: int, h: int, c) -> None:
+    # Draw a spider-like alien creature
+    # Body (oval)
+    pygame.draw.ellipse(surface, c, (x + w // 8, y + h // 4, w * 3 // 4, h // 2))
+    # Eyes (black)
+    pygame.draw.circle(surface, (0,0,0), (x + w // 3, y + h // 2), w // 10)
+    pygame.draw.circle(surface, (0,0,0), (x + w - w // 3, y + h // 2), w // 10)
+    # Fangs (white)
+    pygame.draw.rect(surface, (255,255,255), (x + w // 2 - w // 12, y + h // 2 + h // 6, w // 24, h // 8))
+    pygame.draw.rect(surface, (255,255,255), (x + w // 2 + w // 24, y + h // 2 + h // 6, w // 24, h // 8))
+    # Legs (8 legs)
+    leg_color = (40,40,40)
+    leg_len = w // 3
+    for i in range(4):
+        # Left legs
+        start = (x + w // 4, y + h // 2 + i * h // 10)
+        end = (start[0] - leg_len, start[1] + leg_len // 2)
+        pygame.draw.line(surface, leg_color, start, end, 2)
+        # Right legs
+        start = (x + w - w // 4, y + h // 2 + i * h // 10)
+        end = (start[0] + leg_len, start[1] + leg_len // 2)
+        pygame.draw.line(surface, leg_color, start, end, 2)
+
 
 class Alien:
-    def __init__(self, x: int, y: int, w: int, h: int, value: int, color=(255,255,255)) -> None:
+    def __init__(self, x: int, y: int, w: int, h: int, value: int, color=(255,255,255), row: int = 0, col: int = 0) -> None:
         self.rect = pygame.Rect(x, y, w, h)
         self.value = value
         self.color = color
         self.alive = True
+        # Slot in the formation grid
+        self.row = row
+        self.col = col
+        self.sprite = alien_sprite(w, h, color)
+        self.pad = sprite_padding(w)
 
     def draw(self, surface: pygame.Surface) -> None:
-        # Draw a spider-like alien creature
-        x, y, w, h = self.rect.x, self.rect.y, self.rect.width, self.rect.height
-        c = self.color
-        # Body (oval)
-        pygame.draw.ellipse(surface, c, (x + w // 8, y + h // 4, w * 3 // 4, h // 2))
-        # Eyes (black)
-        pygame.draw.circle(surface, (0,0,0), (x + w // 3, y + h // 2), w // 10)
-        pygame.draw.circle(surface, (0,0,0), (x + w - w // 3, y + h // 2), w // 10)
-        # Fangs (white)
-        pygame.draw.rect(surface, (255,255,255), (x + w // 2 - w // 12, y + h // 2 + h // 6, w // 24, h // 8))
-        pygame.draw.rect(surface, (255,255,255), (x + w // 2 + w // 24, y + h // 2 + h // 6, w // 24, h // 8))
-        # Legs (8 legs)
-        leg_color = (40,40,40)
-        leg_len = w // 3
-        for i in range(4):
-            # Left legs
-            start = (x + w // 4, y + h // 2 + i * h // 10)
-            end = (start[0] - leg_len, start[1] + leg_len // 2)
-            pygame.draw.line(surface, leg_color, start, end, 2)
-            # Right legs
-            start = (x + w - w // 4, y + h // 2 + i * h // 10)
-            end = (start[0] + leg_len, start[1] + leg_len // 2)
-            pygame.draw.line(surface, leg_color, start, end, 2)
+        surface.blit(self.sprite, (self.rect.x - self.pad, self.rect.y - self.pad))
+
+
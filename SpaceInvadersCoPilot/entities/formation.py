@@ -19,6 +19,7 @@ from settings import (
     ALIEN_BULLET_SPEED,
     ALIEN_BULLET_WIDTH,
     ALIEN_BULLET_HEIGHT,
+    ALIEN_FORMATION_LAYER,
     WINDOW_WIDTH,
     WHITE,
 )
@@ -37,35 +38,73 @@ class Formation:
             row: List[Optional[Alien]] = []
             x = ALIEN_START_X
             for c in range(ALIEN_COLS):
-                row.append(Alien(x, y, 32, 24, values[r % len(values)], colors[r % len(colors)]))
+                row.append(Alien(x, y, 32, 24, values[r % len(values)], colors[r % len(colors)], r, c))
                 x += ALIEN_X_SPACING
             self.aliens.append(row)
             y += ALIEN_Y_SPACING
 
+        # Live bookkeeping, kept current by kill() so per-frame queries are O(1)
+        self.live: List[Alien] = [a for row in self.aliens for a in row if a]
+        self.live_count = len(self.live)
+        # Row index of the lowest live alien per column (-1 once the column is empty)
+        self.lowest_row: List[int] = [ALIEN_ROWS - 1] * ALIEN_COLS
+        self.live_columns: List[int] = list(range(ALIEN_COLS))
+        # Top-left of the (0, 0) slot; every alien sits on this fixed lattice
+        self.origin_x = ALIEN_START_X
+        self.origin_y = ALIEN_START_Y
+
+        # Optional composited swarm. Aliens keep fixed lattice offsets from the
+        # origin, so the layer is only redrawn after a kill and is otherwise
+        # blitted at the current origin.
+        self.layer: Optional[pygame.Surface] = None
+        self.layer_pad = self.live[0].pad if self.live else 0
+        self.layer_dirty = True
+
         self.direction = 1  # 1 right, -1 left
         self.step_timer = ALIEN_BASE_STEP_TIME
         self.current_step_time = ALIEN_BASE_STEP_TIME
         self.bounds = self.compute_bounds()
 
     def compute_bounds(self) -> pygame.Rect:
-        rects = [a.rect for row in self.aliens for a in row if a]
-        if not rects:
+        if not self.live:
             return pygame.Rect(0, 0, 0, 0)
-        min_x = min(r.left for r in rects)
-        max_x = max(r.right for r in rects)
-        min_y = min(r.top for r in rects)
-        max_y = max(r.bottom for r in rects)
-        return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+        return self.live[0].rect.unionall([a.rect for a in self.live])
 
     def alive_aliens(self) -> List[Alien]:
-        return [a for row in self.aliens for a in row if a and a.alive]
+        return self.live
 
     def count(self) -> int:
-        return len(self.alive_aliens())
+        return self.live_count
+
+    def kill(self, alien: Alien) -> None:
+        if not alien.alive:
+            return
+        alien.alive = False
+        self.live.remove(alien)
+        self.live_count -= 1
+        self.layer_dirty = True
+
+        # Walk the column pointer up past any dead aliens
+        col = alien.col
+        if self.lowest_row[col] == alien.row:
+            r = alien.row - 1
+            while r >= 0:
+                a = self.aliens[r][col]
+                if a and a.alive:
+                    break
+                r -= 1
+            self.lowest_row[col] = r
+            if r < 0:
+                self.live_columns.remove(col)
+
+        # Bounds only shrink when the dead alien was on the edge
+        b = self.bounds
+        rect = alien.rect
+        if rect.left <= b.left or rect.right >= b.right or rect.top <= b.top or rect.bottom >= b.bottom:
+            self.bounds = self.compute_bounds()
 
     def update(self, dt: float) -> None:
-        alive = self.alive_aliens()
-        count = len(alive)
+        count = self.live_count
         if count == 0:
             return
         # Speed up as aliens decrease
@@ -75,39 +114,65 @@ class Formation:
         if self.step_timer <= 0:
             self.step_timer = self.current_step_time
             # Check edge and move
-            self.bounds = self.compute_bounds()
             hit_edge = (self.direction > 0 and self.bounds.right + ALIEN_STEP_X >= WINDOW_WIDTH - 10) or (
                 self.direction < 0 and self.bounds.left - ALIEN_STEP_X <= 10
             )
             if hit_edge:
                 # drop and reverse
-                for a in alive:
-                    a.rect.y += ALIEN_STEP_Y
+                dx, dy = 0, ALIEN_STEP_Y
                 self.direction *= -1
             else:
-                for a in alive:
-                    a.rect.x += ALIEN_STEP_X * self.direction
-            self.bounds = self.compute_bounds()
+                dx, dy = ALIEN_STEP_X * self.direction, 0
+            for a in self.live:
+                a.rect.move_ip(dx, dy)
+            self.bounds.move_ip(dx, dy)
+            self.origin_x += dx
+            self.origin_y += dy
 
-    def lowest_in_column(self, col: int) -> Optional[Alien]:
-        for r in range(ALIEN_ROWS - 1, -1, -1):
-            a = self.aliens[r][col]
-            if a and a.alive:
-                return a
+    def alien_at(self, rect: pygame.Rect) -> Optional[Alien]:
+        # Only the lattice cells under the rect can hold a colliding alien;
+        # aliens are smaller than the spacing so each stays inside its cell.
+        if self.live_count == 0 or not rect.colliderect(self.bounds):
+            return None
+        c0 = max((rect.left - self.origin_x) // ALIEN_X_SPACING, 0)
+        c1 = min((rect.right - 1 - self.origin_x) // ALIEN_X_SPACING, ALIEN_COLS - 1)
+        r0 = max((rect.top - self.origin_y) // ALIEN_Y_SPACING, 0)
+        r1 = min((rect.bottom - 1 - self.origin_y) // ALIEN_Y_SPACING, ALIEN_ROWS - 1)
+        for r in range(r0, r1 + 1):
+            row = self.aliens[r]
+            for c in range(c0, c1 + 1):
+                a = row[c]
+                if a and a.alive and a.rect.colliderect(rect):
+                    return a
         return None
 
+    def lowest_in_column(self, col: int) -> Optional[Alien]:
+        r = self.lowest_row[col]
+        return self.aliens[r][col] if r >= 0 else None
+
     def try_fire(self) -> Optional[Projectile]:
         # Random chance to fire each call; caller can control rate
-        cols = list(range(ALIEN_COLS))
-        random.shuffle(cols)
-        for col in cols:
-            a = self.lowest_in_column(col)
-            if a is not None:
-                bx = a.rect.centerx - ALIEN_BULLET_WIDTH // 2
-                by = a.rect.bottom
-                return Projectile(bx, by, ALIEN_BULLET_WIDTH, ALIEN_BULLET_HEIGHT, ALIEN_BULLET_SPEED, WHITE)
-        return None
+        if not self.live_columns:
+            return None
+        a = self.lowest_in_column(random.choice(self.live_columns))
+        bx = a.rect.centerx - ALIEN_BULLET_WIDTH // 2
+        by = a.rect.bottom
+        return Projectile(bx, by, ALIEN_BULLET_WIDTH, ALIEN_BULLET_HEIGHT, ALIEN_BULLET_SPEED, WHITE)
+
+    def redraw_layer(self) -> None:
+        if self.layer is None:
+            a = self.aliens[ALIEN_ROWS - 1][ALIEN_COLS - 1]
+            w = (ALIEN_COLS - 1) * ALIEN_X_SPACING + a.sprite.get_width()
+            h = (ALIEN_ROWS - 1) * ALIEN_Y_SPACING + a.sprite.get_height()
+            self.layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        self.layer.fill((0, 0, 0, 0))
+        self.layer.blits([(a.sprite, (a.col * ALIEN_X_SPACING, a.row * ALIEN_Y_SPACING)) for a in self.live], False)
+        self.layer_dirty = False
 
     def draw(self, surface: pygame.Surface) -> None:
-        for a in self.alive_aliens():
-            a.draw(surface)
+        if not ALIEN_FORMATION_LAYER:
+            surface.blits([(a.sprite, (a.rect.x - a.pad, a.rect.y - a.pad)) for a in self.live], False)
+            return
+        if self.layer_dirty:
+            self.redraw_layer()
+        surface.blit(self.layer, (self.origin_x - self.layer_pad, self.origin_y - self.layer_pad))
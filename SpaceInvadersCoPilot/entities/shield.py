@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 import pygame
 
-from settings import SHIELD_BLOCK_SIZE, SHIELD_WIDTH, SHIELD_HEIGHT, WHITE
+from settings import SHIELD_BLOCK_SIZE, SHIELD_WIDTH, SHIELD_HEIGHT, WHITE, BLACK
 
 
 class Shield:
@@ -13,24 +14,33 @@ class Shield:
         self.y = y
         self.cols = SHIELD_WIDTH // SHIELD_BLOCK_SIZE
         self.rows = SHIELD_HEIGHT // SHIELD_BLOCK_SIZE
+        self.rect = pygame.Rect(x, y, self.cols * SHIELD_BLOCK_SIZE, self.rows * SHIELD_BLOCK_SIZE)
         # True means intact block
-        self.grid: List[List[bool]] = [[True for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = np.ones((self.rows, self.cols), dtype=bool)
 
         # carve a notch shape at bottom
-        for r in range(self.rows - 4, self.rows):
-            for c in range(self.cols):
-                if abs(c - self.cols // 2) < (self.rows - r):
-                    self.grid[r][c] = False
+        r = np.arange(self.rows)[:, None]
+        c = np.arange(self.cols)[None, :]
+        notch = (r >= self.rows - 4) & (np.abs(c - self.cols // 2) < (self.rows - r))
+        self.grid[notch] = False
+
+        # Pre-rendered shield; hits only clear the eroded blocks from it
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(BLACK)
+        self.surface.set_colorkey(BLACK)
+        for r, c in np.argwhere(self.grid):
+            self.surface.fill(WHITE, (c * SHIELD_BLOCK_SIZE, r * SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE))
+
+        self._rects: Optional[List[pygame.Rect]] = None
 
     def rects(self) -> List[pygame.Rect]:
-        rs: List[pygame.Rect] = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c]:
-                    rx = self.x + c * SHIELD_BLOCK_SIZE
-                    ry = self.y + r * SHIELD_BLOCK_SIZE
-                    rs.append(pygame.Rect(rx, ry, SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE))
-        return rs
+        # Built on demand and reused until the next hit changes the grid
+        if self._rects is None:
+            self._rects = [
+                pygame.Rect(self.x + c * SHIELD_BLOCK_SIZE, self.y + r * SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE)
+                for r, c in np.argwhere(self.grid)
+            ]
+        return self._rects
 
     def hit(self, point_rect: pygame.Rect) -> bool:
         # Find the grid cell overlapped by projectile rect center
@@ -40,21 +50,18 @@ class Shield:
             return False
         c = cx // SHIELD_BLOCK_SIZE
         r = cy // SHIELD_BLOCK_SIZE
-        if 0 <= r < self.rows and 0 <= c < self.cols and self.grid[r][c]:
+        if 0 <= r < self.rows and 0 <= c < self.cols and self.grid[r, c]:
             # Erode a small 3x3 area around impact
-            for dr in range(-1, 2):
-                for dc in range(-1, 2):
-                    rr = r + dr
-                    cc = c + dc
-                    if 0 <= rr < self.rows and 0 <= cc < self.cols:
-                        self.grid[rr][cc] = False
+            r0, r1 = max(r - 1, 0), min(r + 2, self.rows)
+            c0, c1 = max(c - 1, 0), min(c + 2, self.cols)
+            self.grid[r0:r1, c0:c1] = False
+            self.surface.fill(
+                BLACK,
+                (c0 * SHIELD_BLOCK_SIZE, r0 * SHIELD_BLOCK_SIZE, (c1 - c0) * SHIELD_BLOCK_SIZE, (r1 - r0) * SHIELD_BLOCK_SIZE),
+            )
+            self._rects = None
             return True
         return False
 
     def draw(self, surface: pygame.Surface) -> None:
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c]:
-                    rx = self.x + c * SHIELD_BLOCK_SIZE
-                    ry = self.y + r * SHIELD_BLOCK_SIZE
-                    pygame.draw.rect(surface, WHITE, (rx, ry, SHIELD_BLOCK_SIZE, SHIELD_BLOCK_SIZE))
+        surface.blit(self.surface, (self.x, self.y))
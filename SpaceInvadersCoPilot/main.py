@@ -1,3 +1,4 @@
+import logging
 import sys
 import pygame
 
@@ -7,9 +8,11 @@ from settings import (
     WINDOW_TITLE,
     TARGET_FPS,
     BLACK,
+    DEBUG,
 )
-from systems.persistence import load_settings
+from systems.persistence import load_settings, preload_highscores
 from systems.audio import Audio
+from systems.resources import Resources
 
 # Scene imports
 from scenes.menu import MenuScene
@@ -24,12 +27,25 @@ class Game:
         self.running = True
         self.audio = Audio()
         self.settings = load_settings()
+        preload_highscores()
+        self.resources = Resources()
 
-        self.scene = MenuScene(self)
+        # Scenes are built once and reused across transitions
+        self.scenes = {}
+        self.scene = None
+        self.change_scene(MenuScene)
 
     def set_scene(self, new_scene) -> None:
         self.scene = new_scene
 
+    def change_scene(self, scene_cls, *args) -> None:
+        scene = self.scenes.get(scene_cls)
+        if scene is None:
+            scene = scene_cls(self)
+            self.scenes[scene_cls] = scene
+        scene.enter(*args)
+        self.scene = scene
+
     def quit(self) -> None:
         self.running = False
 
@@ -52,4 +68,6 @@ class Game:
 
 
 if __name__ == "__main__":
+    if DEBUG:
+        logging.basicConfig(level=logging.DEBUG)
     Game().run()
@@ -1,22 +1,23 @@
 import pygame
 
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, SMALL_FONT_SIZE, TITLE_FONT_SIZE, GREEN
-from systems.persistence import submit_highscore, load_highscores
+from systems.persistence import submit_highscore, is_highscore
 
 
 class GameOverScene:
-    def __init__(self, game, score: int) -> None:
+    def __init__(self, game) -> None:
         self.game = game
+        self.score = 0
+        self.title_font = game.resources.font(TITLE_FONT_SIZE)
+        self.font = game.resources.font(SMALL_FONT_SIZE + 4)
+        self.need_initials = False
+        self.initials = ""
+
+    def enter(self, score: int) -> None:
         self.score = score
-        self.title_font = pygame.font.SysFont(None, TITLE_FONT_SIZE)
-        self.font = pygame.font.SysFont(None, SMALL_FONT_SIZE + 4)
 
-        # Simple high score check
-        scores = load_highscores()
-        if len(scores) < 10 or (scores and score > scores[-1]["score"]):
-            self.need_initials = True
-        else:
-            self.need_initials = False
+        # High score check against the scores already in memory
+        self.need_initials = is_highscore(score)
         self.initials = ""
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -33,14 +34,14 @@ class GameOverScene:
             else:
                 if event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
                     from scenes.menu import MenuScene
-                    self.game.set_scene(MenuScene(self.game))
+                    self.game.change_scene(MenuScene)
 
     def submit(self) -> None:
         if not self.initials:
             return
         submit_highscore(self.initials, self.score)
         from scenes.high_scores import HighScoresScene
-        self.game.set_scene(HighScoresScene(self.game))
+        self.game.change_scene(HighScoresScene)
 
     def update(self, dt: float) -> None:
         pass
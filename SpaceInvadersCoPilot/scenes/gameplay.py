@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import List
+from typing import List, Optional
 
 import pygame
 
@@ -32,8 +32,16 @@ from scenes.game_over import GameOverScene
 class GameplayScene:
     def __init__(self, game) -> None:
         self.game = game
-        self.font = pygame.font.SysFont(None, HUD_FONT_SIZE)
+        self.font = game.resources.font(HUD_FONT_SIZE)
+        # Game state is built by enter(), which change_scene() calls right
+        # after constructing the scene
 
+    def enter(self) -> None:
+        # Entering from the menu starts a new game; resuming from pause
+        # switches back to this scene directly and keeps its state
+        self.reset()
+
+    def reset(self) -> None:
         self.player = Player()
         self.formation = Formation()
     # Player bullets now tracked in Player.bullets
@@ -46,6 +54,11 @@ class GameplayScene:
         for _ in range(NUM_SHIELDS):
             self.shields.append(Shield(x, SHIELD_TOP))
             x += SHIELD_WIDTH + spacing
+        # Shields share one y-band and a fixed pitch, which lets collisions
+        # pick the single candidate shield from a bullet's position
+        self.shield_band = self.shields[0].rect.unionall([sh.rect for sh in self.shields])
+        self.shield_x0 = spacing
+        self.shield_pitch = SHIELD_WIDTH + spacing
 
         # UFO
         self.ufo = UFO()
@@ -60,7 +73,7 @@ class GameplayScene:
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_p, pygame.K_ESCAPE):
-                self.game.set_scene(PauseScene(self.game, self))
+                self.game.change_scene(PauseScene, self)
             elif event.key == pygame.K_SPACE:
                 if self.player.fire():
                     self.game.audio.play_sfx("fire")
@@ -106,15 +119,23 @@ class GameplayScene:
         if self.formation.bounds.bottom >= self.player.rect.bottom:
             self.end_game()
 
+    def shield_at(self, rect: pygame.Rect) -> Optional[Shield]:
+        # Shield hits are decided by the projectile centre
+        cx, cy = rect.center
+        if not self.shield_band.collidepoint(cx, cy):
+            return None
+        i = (cx - self.shield_x0) // self.shield_pitch
+        if 0 <= i < len(self.shields) and self.shields[i].rect.collidepoint(cx, cy):
+            return self.shields[i]
+        return None
+
     def handle_collisions(self) -> None:
         # Player bullets vs aliens/UFO/shields
         for pb in list(self.player.bullets):
             # Shields
-            for shield in self.shields:
-                if shield.hit(pb.rect):
-                    pb.alive = False
-                    break
-            if not pb.alive:
+            shield = self.shield_at(pb.rect)
+            if shield and shield.hit(pb.rect):
+                pb.alive = False
                 continue
             # UFO
             if self.ufo.active and rect_collision(pb.rect, self.ufo.rect):
@@ -123,30 +144,20 @@ class GameplayScene:
                 pb.alive = False
                 self.game.audio.play_sfx("ufo")
                 continue
-            # Aliens (coarse scan)
-            for row in self.formation.aliens:
-                hit = False
-                for i, alien in enumerate(row):
-                    if alien and alien.alive and rect_collision(pb.rect, alien.rect):
-                        alien.alive = False
-                        self.score += alien.value
-                        pb.alive = False
-                        hit = True
-                        self.game.audio.play_sfx("alien_hit")
-                        break
-                if hit:
-                    break
+            # Aliens (lattice lookup around the bullet)
+            alien = self.formation.alien_at(pb.rect)
+            if alien:
+                self.formation.kill(alien)
+                self.score += alien.value
+                pb.alive = False
+                self.game.audio.play_sfx("alien_hit")
 
         # Alien bullets vs shields and player
         for b in list(self.alien_bullets):
             # Shields
-            shield_hit = False
-            for shield in self.shields:
-                if shield.hit(b.rect):
-                    b.alive = False
-                    shield_hit = True
-                    break
-            if shield_hit:
+            shield = self.shield_at(b.rect)
+            if shield and shield.hit(b.rect):
+                b.alive = False
                 continue
             # Player
             if rect_collision(b.rect, self.player.rect):
@@ -159,7 +170,7 @@ class GameplayScene:
         self.alien_bullets = [b for b in self.alien_bullets if b.alive]
 
     def end_game(self) -> None:
-        self.game.set_scene(GameOverScene(self.game, self.score))
+        self.game.change_scene(GameOverScene, self.score)
 
     def draw(self, surface: pygame.Surface) -> None:
         # Draw shields
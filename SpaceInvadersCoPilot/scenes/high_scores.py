@@ -7,15 +7,18 @@ from systems.persistence import load_highscores
 class HighScoresScene:
     def __init__(self, game) -> None:
         self.game = game
-        self.title_font = pygame.font.SysFont(None, TITLE_FONT_SIZE)
-        self.font = pygame.font.SysFont(None, SMALL_FONT_SIZE + 4)
+        self.title_font = game.resources.font(TITLE_FONT_SIZE)
+        self.font = game.resources.font(SMALL_FONT_SIZE + 4)
+        self.scores = []
+
+    def enter(self) -> None:
         self.scores = load_highscores()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
                 from scenes.menu import MenuScene
-                self.game.set_scene(MenuScene(self.game))
+                self.game.change_scene(MenuScene)
 
     def update(self, dt: float) -> None:
         pass
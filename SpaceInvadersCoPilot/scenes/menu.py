@@ -10,8 +10,11 @@ class MenuScene:
         self.game = game
         self.options = ["Start Game", "High Scores", "Quit"]
         self.index = 0
-        self.title_font = pygame.font.SysFont(None, TITLE_FONT_SIZE)
-        self.menu_font = pygame.font.SysFont(None, SMALL_FONT_SIZE + 6)
+        self.title_font = game.resources.font(TITLE_FONT_SIZE)
+        self.menu_font = game.resources.font(SMALL_FONT_SIZE + 6)
+
+    def enter(self) -> None:
+        self.index = 0
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -25,9 +28,9 @@ class MenuScene:
     def activate(self) -> None:
         option = self.options[self.index]
         if option == "Start Game":
-            self.game.set_scene(GameplayScene(self.game))
+            self.game.change_scene(GameplayScene)
         elif option == "High Scores":
-            self.game.set_scene(HighScoresScene(self.game))
+            self.game.change_scene(HighScoresScene)
         elif option == "Quit":
             self.game.quit()
 
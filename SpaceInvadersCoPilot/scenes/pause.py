@@ -4,13 +4,18 @@ from settings import WHITE, SMALL_FONT_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, GREEN
 
 
 class PauseScene:
-    def __init__(self, game, gameplay_scene) -> None:
+    def __init__(self, game) -> None:
         self.game = game
-        self.gameplay_scene = gameplay_scene
-        self.font = pygame.font.SysFont(None, SMALL_FONT_SIZE + 8)
+        self.gameplay_scene = None
+        self.font = game.resources.font(SMALL_FONT_SIZE + 8)
+        self.overlay = game.resources.overlay((0, 0, 0, 180))
         self.options = ["Resume", "Quit to Menu"]
         self.index = 0
 
+    def enter(self, gameplay_scene) -> None:
+        self.gameplay_scene = gameplay_scene
+        self.index = 0
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_UP, pygame.K_w):
@@ -26,15 +31,13 @@ class PauseScene:
             self.game.set_scene(self.gameplay_scene)
         else:
             from scenes.menu import MenuScene
-            self.game.set_scene(MenuScene(self.game))
+            self.game.change_scene(MenuScene)
 
     def update(self, dt: float) -> None:
         pass
 
     def draw(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.overlay, (0, 0))
 
         for i, text in enumerate(self.options):
             color = GREEN if i == self.index else WHITE
@@ -41,6 +41,7 @@ ALIEN_BULLET_SPEED = 250
 ALIEN_BULLET_WIDTH = 4
 ALIEN_BULLET_HEIGHT = 12
 ALIEN_MAX_CONCURRENT_BULLETS = 4
+ALIEN_FORMATION_LAYER = True  # composite the swarm into one surface, redrawn only on kills
 
 # Shields
 NUM_SHIELDS = 4
@@ -66,6 +67,10 @@ SMALL_FONT_SIZE = 18
 SETTINGS_FILE = "settings.json"
 HIGHSCORES_FILE = "highscores.json"
 MAX_HIGHSCORES = 10
+# "json" keeps the files above; "sqlite" stores scores and settings in
+# DATABASE_FILE, importing the JSON files once on first use
+STORAGE_BACKEND = "json"
+DATABASE_FILE = "spaceinvaders.db"
 
 # Audio (volumes 0.0 - 1.0)
 MASTER_VOLUME = 0.6
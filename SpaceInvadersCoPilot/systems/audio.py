@@ -1,9 +1,27 @@
-from typing import Optional
+import logging
+from typing import Dict, Optional, Tuple
 
 import pygame
 
 from settings import MASTER_VOLUME, SFX_VOLUME
 
+logger = logging.getLogger(__name__)
+
+# event -> (frequency Hz, duration ms)
+SFX_TONES: Dict[str, Tuple[int, int]] = {
+    "fire": (880, 60),
+    "alien_hit": (440, 80),
+    "player_hit": (220, 120),
+    "ufo": (1320, 100),
+}
+# Minimum seconds between two plays of the same event
+SFX_MIN_INTERVAL: Dict[str, float] = {
+    "fire": 0.05,
+    "alien_hit": 0.03,
+    "player_hit": 0.0,
+    "ufo": 0.1,
+}
+
 
 class Audio:
     def __init__(self) -> None:
@@ -12,11 +30,31 @@ class Audio:
             pygame.mixer.init()
             pygame.mixer.music.set_volume(MASTER_VOLUME)
             self.initialized = True
-            print("[Audio] Mixer initialized successfully.")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Mixer initialized successfully.")
         except Exception as e:
-            print(f"[Audio] Mixer initialization failed: {e}")
+            logger.warning("Mixer initialization failed: %s", e)
             self.initialized = False
         self.sounds: dict[str, pygame.mixer.Sound] = {}
+        # Synthesized tones keyed by (frequency, duration_ms, mixer format)
+        self.tones: dict[tuple, pygame.mixer.Sound] = {}
+        # One reserved channel per SFX event so bursts of one event can't
+        # steal the channel another event is playing on
+        self.channels: dict[str, pygame.mixer.Channel] = {}
+        self.last_played: dict[str, float] = {}
+
+        if self.initialized:
+            self._reserve_channels()
+            for frequency, duration_ms in SFX_TONES.values():
+                self.tone(frequency, duration_ms)
+
+    def _reserve_channels(self) -> None:
+        needed = len(SFX_TONES)
+        if pygame.mixer.get_num_channels() < needed + 4:
+            pygame.mixer.set_num_channels(needed + 4)
+        pygame.mixer.set_reserved(needed)
+        for i, event in enumerate(SFX_TONES):
+            self.channels[event] = pygame.mixer.Channel(i)
 
     def load_sound(self, key: str, path: Optional[str] = None) -> None:
         if not self.initialized or not path:
@@ -38,40 +76,56 @@ class Audio:
             except Exception:
                 pass
 
-    def beep(self, frequency: int = 880, duration_ms: int = 60) -> None:
-        # Generate a sine wave beep using numpy and play it
-        if not self.initialized:
-            print(f"[Audio] Mixer not initialized, cannot play beep {frequency}Hz.")
-            return
+    def tone(self, frequency: int, duration_ms: int) -> Optional[pygame.mixer.Sound]:
+        # Return the sine tone for these parameters, synthesizing it only once
+        init = pygame.mixer.get_init()
+        if not init:
+            return None
+        key = (frequency, duration_ms, init)
+        sound = self.tones.get(key)
+        if sound is not None:
+            return sound
         try:
             import numpy
-            init = pygame.mixer.get_init()
-            if not init:
-                print("[Audio] Mixer not initialized (get_init is None).")
-                return
             sample_rate, _, channels = init
             n_samples = int(sample_rate * duration_ms / 1000)
-            t = numpy.linspace(0, duration_ms / 1000, n_samples, False)
+            t = numpy.arange(n_samples) / sample_rate
             wave = (numpy.sin(2 * numpy.pi * frequency * t) * 32767 * 0.4).astype(numpy.int16)
             if channels >= 2:
                 # Create stereo by duplicating mono signal across channels
-                wave = numpy.column_stack((wave, wave)).copy(order="C")
-            else:
-                # Ensure shape is (n,)
-                wave = wave.copy(order="C")
+                wave = numpy.repeat(wave[:, None], channels, axis=1)
             sound = pygame.sndarray.make_sound(wave)
-            print(f"[Audio] Playing beep {frequency}Hz for {duration_ms}ms.")
-            sound.play(maxtime=duration_ms)
+            sound.set_volume(SFX_VOLUME)
         except Exception as e:
-            print(f"[Audio] Beep generation failed: {e}")
+            logger.warning("Tone generation failed for %sHz: %s", frequency, e)
+            return None
+        self.tones[key] = sound
+        return sound
+
+    def beep(self, frequency: int = 880, duration_ms: int = 60, channel: Optional[pygame.mixer.Channel] = None) -> None:
+        if not self.initialized:
+            return
+        sound = self.tone(frequency, duration_ms)
+        if sound is None:
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Playing beep %sHz for %sms.", frequency, duration_ms)
+        if channel is not None:
+            channel.play(sound)
+        else:
+            sound.play()
 
     def play_sfx(self, event: str) -> None:
-        print(f"[Audio] SFX event triggered: {event}")
-        if event == "fire":
-            self.beep(880, 60)
-        elif event == "alien_hit":
-            self.beep(440, 80)
-        elif event == "player_hit":
-            self.beep(220, 120)
-        elif event == "ufo":
-            self.beep(1320, 100)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SFX event triggered: %s", event)
+        if not self.initialized:
+            return
+        tone = SFX_TONES.get(event)
+        if tone is None:
+            return
+        # Throttle repeats of the same event
+        now = pygame.time.get_ticks() / 1000.0
+        if now - self.last_played.get(event, -1.0) < SFX_MIN_INTERVAL.get(event, 0.0):
+            return
+        self.last_played[event] = now
+        self.beep(tone[0], tone[1], self.channels.get(event))
@@ -1,8 +1,16 @@
 import json
+import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from settings import HIGHSCORES_FILE, MAX_HIGHSCORES, SETTINGS_FILE
+from settings import DATABASE_FILE, HIGHSCORES_FILE, MAX_HIGHSCORES, SETTINGS_FILE, STORAGE_BACKEND
+from systems.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+_store: Optional[SQLiteStore] = None
+# JSON backend: the top scores, read from disk once and kept current by submit_highscore
+_json_scores: Optional[List[Dict[str, Any]]] = None
 
 
 def _file_path(filename: str) -> Path:
@@ -10,6 +18,20 @@ def _file_path(filename: str) -> Path:
     return Path(__file__).resolve().parent.parent / filename
 
 
+def _sqlite_store() -> Optional[SQLiteStore]:
+    global _store
+    if STORAGE_BACKEND != "sqlite":
+        return None
+    if _store is None:
+        _store = SQLiteStore(
+            _file_path(DATABASE_FILE),
+            highscores_json=_file_path(HIGHSCORES_FILE),
+            settings_json=_file_path(SETTINGS_FILE),
+            top_n=MAX_HIGHSCORES,
+        )
+    return _store
+
+
 def load_json(filename: str, default: Any) -> Any:
     path = _file_path(filename)
     try:
@@ -26,36 +48,67 @@ def save_json(filename: str, data: Any) -> None:
     try:
         with path.open("w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
-    except Exception:
-        # Best effort; ignore write failures in game loop
-        pass
+    except Exception as e:
+        # Best effort; don't crash the game loop, but don't hide the failure
+        logger.warning("Could not save %s: %s", path, e)
 
 
 def load_settings() -> Dict[str, Any]:
+    store = _sqlite_store()
+    if store is not None:
+        return store.load_settings()
     return load_json(SETTINGS_FILE, {})
 
 
 def save_settings(settings: Dict[str, Any]) -> None:
+    store = _sqlite_store()
+    if store is not None:
+        store.save_settings(settings)
+        return
     save_json(SETTINGS_FILE, settings)
 
 
+def _json_highscores() -> List[Dict[str, Any]]:
+    global _json_scores
+    if _json_scores is None:
+        data = load_json(HIGHSCORES_FILE, [])
+        # Normalize
+        items: List[Dict[str, Any]] = []
+        for it in data if isinstance(data, list) else []:
+            if isinstance(it, dict) and "initials" in it and "score" in it:
+                items.append({"initials": str(it["initials"])[:3].upper(), "score": int(it["score"])})
+        items.sort(key=lambda d: d["score"], reverse=True)
+        _json_scores = items[:MAX_HIGHSCORES]
+    return _json_scores
+
+
+def preload_highscores() -> None:
+    """Read the score table at startup so no scene transition has to."""
+    if _sqlite_store() is None:
+        _json_highscores()
+
+
 def load_highscores() -> List[Dict[str, Any]]:
-    data = load_json(HIGHSCORES_FILE, [])
-    # Normalize
-    if not isinstance(data, list):
-        return []
-    items: List[Dict[str, Any]] = []
-    for it in data:
-        if isinstance(it, dict) and "initials" in it and "score" in it:
-            items.append({"initials": str(it["initials"])[:3].upper(), "score": int(it["score"])})
-    items.sort(key=lambda d: d["score"], reverse=True)
-    return items[:MAX_HIGHSCORES]
+    store = _sqlite_store()
+    if store is not None:
+        return store.top_scores(MAX_HIGHSCORES)
+    return [dict(it) for it in _json_highscores()]
+
+
+def is_highscore(score: int) -> bool:
+    """Would 'score' make the table? Answered from the scores held in memory."""
+    store = _sqlite_store()
+    scores = store.top_scores_view() if store is not None else _json_highscores()
+    return len(scores) < MAX_HIGHSCORES or score > scores[-1]["score"]
 
 
 def submit_highscore(initials: str, score: int) -> List[Dict[str, Any]]:
-    scores = load_highscores()
+    store = _sqlite_store()
+    if store is not None:
+        return store.add_score(initials, score)
+    scores = _json_highscores()
     scores.append({"initials": initials[:3].upper(), "score": int(score)})
     scores.sort(key=lambda d: d["score"], reverse=True)
-    scores = scores[:MAX_HIGHSCORES]
+    del scores[MAX_HIGHSCORES:]
     save_json(HIGHSCORES_FILE, scores)
-    return scores
+    return [dict(it) for it in scores]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable, Tuple
+
+import pygame
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+
+class Resources:
+    # Lazily created fonts and surfaces shared by all scenes. SysFont scans
+    # the system fonts, so each size is only ever looked up once.
+    def __init__(self) -> None:
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        self.surfaces: Dict[Hashable, pygame.Surface] = {}
+
+    def font(self, size: int) -> pygame.font.Font:
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(None, size)
+            self.fonts[size] = font
+        return font
+
+    def surface(self, key: Hashable, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = factory()
+            self.surfaces[key] = surf
+        return surf
+
+    def overlay(self, rgba: Tuple[int, int, int, int], size: Tuple[int, int] = (WINDOW_WIDTH, WINDOW_HEIGHT)) -> pygame.Surface:
+        def make() -> pygame.Surface:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(rgba)
+            return surf
+
+        return self.surface(("overlay", size, rgba), make)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS highscores (
+    id INTEGER PRIMARY KEY,
+    initials TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_highscores_score ON highscores (score DESC, id);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+# High scores and settings in SQLite. Reads use the main-thread connection
+# and top-N queries walk the score index, so they stay cheap however many
+# rows accumulate. Writes are queued to a writer thread with its own
+# connection, and the top-N list is mirrored in memory so a submitted score
+# is visible immediately.
+class SQLiteStore:
+    def __init__(self, path: Path, highscores_json: Optional[Path] = None,
+                 settings_json: Optional[Path] = None, top_n: int = 10) -> None:
+        self.path = path
+        self.top_n = top_n
+        self.conn = _connect(path)
+        self._closed = False
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self._migrate_json(highscores_json, settings_json)
+
+        self._top: List[Dict[str, Any]] = self._query_top(top_n)
+        self._writes: "queue.Queue[Optional[Callable[[sqlite3.Connection], None]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._run_writer, name="highscore-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _migrate_json(self, highscores_json: Optional[Path], settings_json: Optional[Path]) -> None:
+        # One-time import of the legacy JSON files; the files are left in place
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+        if row is not None:
+            return
+        scores = _read_json(highscores_json, [])
+        settings = _read_json(settings_json, {})
+        now = time.time()
+        rows = []
+        for it in scores if isinstance(scores, list) else []:
+            # Skip malformed entries, as the JSON loader did
+            try:
+                rows.append((str(it["initials"])[:3].upper(), int(it["score"]), now))
+            except (KeyError, TypeError, ValueError):
+                continue
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO highscores (initials, score, created) VALUES (?, ?, ?)", rows
+            )
+            if isinstance(settings, dict):
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                    [(str(k), json.dumps(v)) for k, v in settings.items()],
+                )
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(now),))
+
+    def _query_top(self, n: int) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT initials, score FROM highscores ORDER BY score DESC, id LIMIT ?", (n,)
+        ).fetchall()
+        return [{"initials": initials, "score": score} for initials, score in rows]
+
+    def top_scores(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        if n is None or n <= self.top_n:
+            return [dict(it) for it in self._top[: n if n is not None else self.top_n]]
+        self.flush()
+        return self._query_top(n)
+
+    def top_scores_view(self) -> Sequence[Dict[str, Any]]:
+        """The in-memory top-N list itself, without copying; don't modify it."""
+        return self._top
+
+    def load_settings(self) -> Dict[str, Any]:
+        self.flush()
+        return {k: json.loads(v) for k, v in self.conn.execute("SELECT key, value FROM settings")}
+
+    def add_score(self, initials: str, score: int) -> List[Dict[str, Any]]:
+        entry = {"initials": initials[:3].upper(), "score": int(score)}
+        # Ties keep insertion order, matching ORDER BY score DESC, id
+        i = len(self._top)
+        while i > 0 and self._top[i - 1]["score"] < entry["score"]:
+            i -= 1
+        self._top.insert(i, entry)
+        del self._top[self.top_n:]
+
+        created = time.time()
+        self._submit(lambda conn: conn.execute(
+            "INSERT INTO highscores (initials, score, created) VALUES (?, ?, ?)",
+            (entry["initials"], entry["score"], created),
+        ))
+        return self.top_scores()
+
+    def save_settings(self, settings: Dict[str, Any]) -> None:
+        items = [(str(k), json.dumps(v)) for k, v in settings.items()]
+
+        def write(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM settings")
+            conn.executemany("INSERT INTO settings (key, value) VALUES (?, ?)", items)
+
+        self._submit(write)
+
+    def _submit(self, op: Callable[[sqlite3.Connection], None]) -> None:
+        if self._writer.is_alive():
+            self._writes.put(op)
+        elif not self._closed:
+            # Writer already stopped (e.g. during shutdown); write inline
+            with self.conn:
+                op(self.conn)
+        else:
+            # Store already closed; use a short-lived connection
+            conn = _connect(self.path)
+            try:
+                with conn:
+                    op(conn)
+            finally:
+                conn.close()
+
+    def _run_writer(self) -> None:
+        conn = _connect(self.path)
+        try:
+            while True:
+                op = self._writes.get()
+                try:
+                    if op is None:
+                        return
+                    with conn:
+                        op(conn)
+                except sqlite3.Error as e:
+                    logger.warning("High score store write failed: %s", e)
+                finally:
+                    self._writes.task_done()
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        if self._writer.is_alive():
+            self._writes.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if self._writer.is_alive():
+            self._writes.put(None)
+            self._writer.join(timeout=5.0)
+        self._closed = True
+        self.conn.close()
+        atexit.unregister(self.close)
+
+
+def _read_json(path: Optional[Path], default: Any) -> Any:
+    if path is None or not path.exists():
+        return default
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read %s for migration: %s", path, e)
+        return default
@@ -10,8 +10,17 @@ import threading
 class SoundManager:
     """Manages all game audio."""
     
-    def __init__(self):
-        """Initialize the sound manager."""
+    def __init__(self, enabled: bool = True):
+        """Initialize the sound manager.
+        
+        Args:
+            enabled: When False the mixer is never touched and every play_*
+                call is a no-op (used by the headless simulation).
+        """
+        self.enabled = enabled
+        if not self.enabled:
+            return
+        
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
         
         # Create simple sound effects using pygame's built-in sound generation
@@ -95,6 +104,9 @@ class SoundManager:
     
     def play_shot_sound(self):
         """Play the shot sound effect."""
+        if not self.enabled:
+            return
+        
         def play_sound():
             self.shot_sound.play()
         
@@ -105,6 +117,9 @@ class SoundManager:
     
     def play_hit_sound(self):
         """Play the hit sound effect."""
+        if not self.enabled:
+            return
+        
         def play_sound():
             self.hit_sound.play()
         
@@ -114,6 +129,9 @@ class SoundManager:
     
     def play_explosion_sound(self):
         """Play the explosion sound effect."""
+        if not self.enabled:
+            return
+        
         def play_sound():
             self.explosion_sound.play()
         
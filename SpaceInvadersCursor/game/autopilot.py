@@ -0,0 +1,162 @@
+"""
+Scripted player for Space Invaders game.
+Drives the player without keyboard input so the simulation can be run
+headless and faster than real time.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class ScriptedPlayer:
+    """Simple autopilot that dodges bombs and shoots whatever lines up."""
+    
+    def __init__(self, lookahead: float = 0.5):
+        """Initialize the scripted player.
+        
+        Args:
+            lookahead: How far ahead (seconds) falling bombs are projected
+        """
+        self.lookahead = lookahead
+        # Bullets in flight and the formation column each was fired at
+        self.bullet_columns: Dict[object, int] = {}
+        self.last_fire_column: Optional[int] = None
+    
+    def control(self, game) -> Tuple[bool, bool, bool]:
+        """Decide the inputs for the next simulation step.
+        
+        Returns:
+            Tuple of (move_left, move_right, fire)
+        """
+        pending = self.track_bullets(game)
+        player = game.player.rect
+        targets = self.aim_points(game)
+        tolerance = game.config.INVADER_WIDTH // 2 - game.config.BULLET_WIDTH
+        
+        # Only shoot at columns that bullets already in flight won't clear
+        self.last_fire_column = None
+        for x, column, size in targets:
+            if abs(x - player.centerx) <= tolerance and pending.get(column, 0) < size:
+                self.last_fire_column = column
+                break
+        fire = self.last_fire_column is not None
+        
+        # Prefer holding still when a shot lines up, otherwise head for the
+        # target that can be reached soonest; either way avoid bombs.
+        toward = 0 if fire or not targets else self.intercept_direction(game, targets)
+        preferred = [toward, 0, -toward] if toward else [0, -1, 1]
+        
+        # max() keeps the first of equally good moves, i.e. the preferred one;
+        # when trapped it picks whichever move delays impact the longest
+        move = max(preferred, key=lambda m: self.time_to_impact(game, m))
+        return move < 0, move > 0, fire
+    
+    def track_bullets(self, game) -> Dict[int, int]:
+        """Update bullet-to-column bookkeeping and count bullets per column."""
+        live = set(game.bullets)
+        for bullet in list(self.bullet_columns):
+            if bullet not in live:
+                del self.bullet_columns[bullet]
+        # A bullet we haven't seen yet was created by our last fire request
+        for bullet in live:
+            if bullet not in self.bullet_columns and self.last_fire_column is not None:
+                self.bullet_columns[bullet] = self.last_fire_column
+        
+        pending: Dict[int, int] = {}
+        for column in self.bullet_columns.values():
+            pending[column] = pending.get(column, 0) + 1
+        return pending
+    
+    def intercept_direction(self, game, targets: List[Tuple[float, int, int]]) -> int:
+        """Pick the direction that reaches a firing position soonest.
+        
+        Targets moving away at nearly the player's speed can't be caught, so
+        closing speed rather than distance decides which aim point to chase.
+        """
+        player = game.player
+        group = game.invader_group
+        best_time = None
+        best_direction = 0
+        
+        for x, _, _ in targets:
+            offset = x - player.rect.centerx
+            direction = 1 if offset > 0 else -1
+            # The formation moves with the target; heading into it closes faster
+            closing = player.speed - direction * group.direction * group.current_speed
+            if closing <= 0:
+                continue
+            time_to_reach = abs(offset) / closing
+            if best_time is None or time_to_reach < best_time:
+                best_time = time_to_reach
+                best_direction = direction
+        return best_direction
+    
+    def time_to_impact(self, game, move: int) -> float:
+        """Seconds until a bomb hits if a direction is held (lookahead if none)."""
+        config = game.config
+        player = game.player
+        rect = player.rect.copy()
+        max_x = config.SCREEN_WIDTH - player.width
+        
+        # Sample every simulation step so fast sideways moves can't skip a bomb
+        t = config.FIXED_DT
+        while t <= self.lookahead:
+            rect.x = round(min(max(player.x + move * player.speed * t, 0), max_x))
+            for bomb in game.invader_group.bombs:
+                bomb_rect = bomb.rect.move(0, round(bomb.speed * t))
+                if bomb_rect.colliderect(rect):
+                    return t
+            t += config.FIXED_DT
+        return self.lookahead
+    
+    def aim_points(self, game) -> List[Tuple[float, int, int]]:
+        """Predict where to stand to hit each invader.
+        
+        Every invader gets its own lead, since a bullet that misses the
+        bottom of a column can still hit an invader higher up.
+        
+        Returns:
+            (x, column, invaders left in the column) for every live invader
+        """
+        config = game.config
+        group = game.invader_group
+        player = game.player.rect
+        if not group.invaders:
+            return []
+        
+        columns = [round(invader.x / config.INVADER_SPACING_X) for invader in group.invaders]
+        sizes: Dict[int, int] = {}
+        for column in columns:
+            sizes[column] = sizes.get(column, 0) + 1
+        
+        left = min(invader.rect.left for invader in group.invaders)
+        right = max(invader.rect.right for invader in group.invaders)
+        
+        aims = []
+        for invader, column in zip(group.invaders, columns):
+            # Lead the target by the distance the formation moves while the bullet flies
+            flight_time = max(0, player.top - invader.rect.bottom) / config.BULLET_SPEED
+            x = invader.rect.centerx + self.formation_shift(game, left, right, flight_time)
+            aims.append((x, column, sizes[column]))
+        return aims
+    
+    def formation_shift(self, game, left: int, right: int, t: float) -> float:
+        """Horizontal distance the formation covers in t seconds, bouncing off the edges."""
+        config = game.config
+        group = game.invader_group
+        speed = group.current_speed
+        direction = group.direction
+        shift = 0.0
+        
+        # The group turns once its extent crosses the 20px margin on either side
+        for _ in range(4):
+            if direction > 0:
+                distance = config.SCREEN_WIDTH - 20 - (right + shift)
+            else:
+                distance = (left + shift) - 20
+            distance = max(distance, 0.0)
+            if speed <= 0 or t * speed <= distance:
+                return shift + direction * speed * t
+            shift += direction * distance
+            t -= distance / speed
+            direction = -direction
+        return shift
@@ -21,7 +21,11 @@ class GameConfig:
     BLUE = (0, 0, 255)
     
     # Game settings
+    # All speeds and durations below are in seconds / pixels per second so the
+    # simulation is independent of the render frame rate.
     FPS = 60
+    FIXED_DT = 1.0 / FPS  # Simulation step in seconds
+    MAX_FRAME_TIME = 0.25  # Clamp long stalls so the fixed-step loop can catch up
     MAX_BULLETS = 5
     BULLETS_PER_LEVEL = 170
     MAX_LEVELS = 12
@@ -29,7 +33,7 @@ class GameConfig:
     # Player settings
     PLAYER_WIDTH = 40  # Reduced from 60 to match invader width
     PLAYER_HEIGHT = 40
-    PLAYER_SPEED = 5
+    PLAYER_SPEED = 300  # pixels per second (5 px/frame at 60 FPS)
     PLAYER_START_X = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
     PLAYER_START_Y = SCREEN_HEIGHT - PLAYER_HEIGHT - 20
     
@@ -42,19 +46,24 @@ class GameConfig:
     INVADER_SPACING_Y = 50
     INVADER_START_X = 50
     INVADER_START_Y = 100
-    INVADER_SPEED_BASE = 0.5  # Reduced from 1 to 0.5 for slower movement
-    INVADER_SPEED_INCREMENT = 0.3  # Reduced from 0.5 to 0.3 for gentler progression
+    INVADER_SPEED_BASE = 30  # pixels per second (0.5 px/frame at 60 FPS)
+    INVADER_SPEED_INCREMENT = 18  # pixels per second per level (0.3 px/frame)
     INVADER_DROP_DISTANCE = 30
+    INVADER_ANIMATION_INTERVAL = 0.5  # seconds between animation frames
+    
+    # Bomb settings
+    BOMB_SPEED = 180  # pixels per second (3 px/frame at 60 FPS)
+    BOMB_DROP_RATE = 0.06  # Expected bombs per invader per second at level 1
     
     # Bullet settings
     BULLET_WIDTH = 4
     BULLET_HEIGHT = 10
-    BULLET_SPEED = 7
+    BULLET_SPEED = 420  # pixels per second (7 px/frame at 60 FPS)
     PLAYER_BULLET_COLOR = GREEN
     INVADER_BULLET_COLOR = RED
     
     # Explosion settings
-    EXPLOSION_DURATION = 20  # frames
+    EXPLOSION_DURATION = 20 / 60  # seconds (20 frames at 60 FPS)
     
     # Font settings
     FONT_SIZE_LARGE = 48
@@ -15,7 +15,7 @@ class Bomb:
         self.config = config
         self.width = 6
         self.height = 8
-        self.speed = 3
+        self.speed = config.BOMB_SPEED
         
         # Create bomb sprite
         self.image = pygame.Surface((self.width, self.height))
@@ -28,10 +28,17 @@ class Bomb:
         self.rect = self.image.get_rect()
         self.rect.x = x - self.width // 2
         self.rect.y = y
+        # Sub-pixel position; the rect is synced from it after each move
+        self.y = float(self.rect.y)
     
-    def update(self):
-        """Update bomb position."""
-        self.rect.y += self.speed
+    def update(self, dt: float):
+        """Update bomb position.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
+        self.y += self.speed * dt
+        self.rect.y = round(self.y)
     
     def is_off_screen(self) -> bool:
         """Check if bomb is off screen."""
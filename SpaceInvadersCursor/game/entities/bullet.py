@@ -34,10 +34,17 @@ class Bullet:
         self.rect = self.image.get_rect()
         self.rect.x = x - self.width // 2
         self.rect.y = y
+        # Sub-pixel position; the rect is synced from it after each move
+        self.y = float(self.rect.y)
     
-    def update(self):
-        """Update bullet position."""
-        self.rect.y += self.direction * self.speed
+    def update(self, dt: float):
+        """Update bullet position.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
+        self.y += self.direction * self.speed * dt
+        self.rect.y = round(self.y)
     
     def is_off_screen(self) -> bool:
         """Check if bullet is off screen."""
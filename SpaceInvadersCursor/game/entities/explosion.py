@@ -13,7 +13,7 @@ class Explosion:
         """Initialize an explosion."""
         self.config = config
         self.position = position
-        self.timer = 0
+        self.timer = 0.0
         self.max_timer = config.EXPLOSION_DURATION
         self.finished = False
         
@@ -21,9 +21,13 @@ class Explosion:
         self.image = pygame.Surface((30, 30))
         self.image.fill(self.config.BACKGROUND_COLOR)
     
-    def update(self):
-        """Update explosion animation."""
-        self.timer += 1
+    def update(self, dt: float):
+        """Update explosion animation.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
+        self.timer += dt
         if self.timer >= self.max_timer:
             self.finished = True
     
@@ -35,7 +39,7 @@ class Explosion:
         """Render the explosion on screen."""
         if not self.finished:
             # Create animated explosion effect
-            explosion_size = int(20 * (self.timer / self.max_timer))
+            explosion_size = int(20 * min(1.0, self.timer / self.max_timer))
             explosion_surface = pygame.Surface((explosion_size * 2, explosion_size * 2))
             explosion_surface.fill(self.config.BACKGROUND_COLOR)
             
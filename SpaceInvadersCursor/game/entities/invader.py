@@ -25,13 +25,16 @@ class Invader:
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        # Sub-pixel position; the rect is synced from it after each move
+        self.x = float(x)
+        self.y = float(y)
         
         # Points for destroying this invader
         self.points = self.get_points_for_type()
         
         # Animation
         self.animation_frame = 0
-        self.animation_timer = 0
+        self.animation_timer = 0.0
     
     def create_invader_sprite(self) -> pygame.Surface:
         """Create the invader sprite."""
@@ -114,15 +117,26 @@ class Invader:
         else:
             return 10
     
-    def update(self):
-        """Update invader animation."""
-        self.animation_timer += 1
-        if self.animation_timer >= 30:  # Change animation every 30 frames
+    def update(self, dt: float):
+        """Update invader animation.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
+        self.animation_timer += dt
+        if self.animation_timer >= self.config.INVADER_ANIMATION_INTERVAL:
             self.animation_frame = (self.animation_frame + 1) % 2
-            self.animation_timer = 0
+            self.animation_timer -= self.config.INVADER_ANIMATION_INTERVAL
             # Redraw sprite with animation
             self.image = self.create_invader_sprite()
     
+    def move(self, dx: float, dy: float = 0.0):
+        """Move the invader by a sub-pixel offset and sync its rect."""
+        self.x += dx
+        self.y += dy
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+    
     def render(self, screen):
         """Render the invader on screen."""
         screen.blit(self.image, self.rect)
@@ -130,18 +144,27 @@ class Invader:
 class InvaderGroup:
     """Group of invaders with movement patterns."""
     
-    def __init__(self, config, level: int):
-        """Initialize invader group."""
+    def __init__(self, config, level: int, rng: Optional[random.Random] = None):
+        """Initialize invader group.
+        
+        Args:
+            config: Game configuration
+            level: Current level (1-based)
+            rng: Random source for bomb drops; pass a seeded instance for
+                reproducible runs. Defaults to the global ``random`` module.
+        """
         self.config = config
         self.level = level
+        self.rng = rng if rng is not None else random
         self.invaders: List[Invader] = []
         self.bombs: List[Bomb] = []
         self.direction = 1  # 1 for right, -1 for left
         self.speed = config.INVADER_SPEED_BASE + (level - 1) * config.INVADER_SPEED_INCREMENT
+        self.current_speed = self.speed  # Horizontal speed including the speed-up for kills
         self.drop_timer = 0
         self.last_drop_time = 0
-        self.bomb_timer = 0
-        self.bomb_drop_chance = 0.001  # Chance per frame for each invader to drop a bomb
+        self.bomb_timer = 0.0
+        self.bomb_drop_rate = config.BOMB_DROP_RATE  # Bombs per invader per second
         
         self.create_invaders()
     
@@ -166,14 +189,18 @@ class InvaderGroup:
                 invader = Invader(self.config, x, y, invader_type)
                 self.invaders.append(invader)
     
-    def update(self):
-        """Update all invaders and handle group movement."""
+    def update(self, dt: float):
+        """Update all invaders and handle group movement.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
         if not self.invaders:
             return
         
         # Update individual invaders
         for invader in self.invaders:
-            invader.update()
+            invader.update(dt)
         
         # Handle group movement
         self.update_group_movement()
@@ -183,14 +210,16 @@ class InvaderGroup:
         total_invaders = self.config.INVADER_ROWS * self.config.INVADER_COLS
         speed_multiplier = 1 + (total_invaders - remaining_invaders) * 0.05  # Reduced from 0.1 to 0.05
         current_speed = self.speed * speed_multiplier
+        self.current_speed = current_speed
         
         # Move invaders horizontally
+        dx = self.direction * current_speed * dt
         for invader in self.invaders:
-            invader.rect.x += self.direction * current_speed
+            invader.move(dx)
         
         # Handle bomb dropping
-        self.update_bombs()
-        self.drop_bombs()
+        self.update_bombs(dt)
+        self.drop_bombs(dt)
     
     def update_group_movement(self):
         """Update the group's movement direction and dropping."""
@@ -213,29 +242,29 @@ class InvaderGroup:
         # Drop invaders down
         if should_drop:
             for invader in self.invaders:
-                invader.rect.y += self.config.INVADER_DROP_DISTANCE
+                invader.move(0.0, self.config.INVADER_DROP_DISTANCE)
     
-    def update_bombs(self):
+    def update_bombs(self, dt: float):
         """Update all bombs."""
         bombs_to_remove = []
         
         for bomb in self.bombs:
-            bomb.update()
+            bomb.update(dt)
             if bomb.is_off_screen():
                 bombs_to_remove.append(bomb)
         
         for bomb in bombs_to_remove:
             self.bombs.remove(bomb)
     
-    def drop_bombs(self):
+    def drop_bombs(self, dt: float):
         """Randomly drop bombs from invaders."""
-        self.bomb_timer += 1
+        self.bomb_timer += dt
         
         # Increase bomb drop chance as level progresses
-        current_bomb_chance = self.bomb_drop_chance * (1 + (self.level - 1) * 0.5)
+        current_bomb_chance = self.bomb_drop_rate * (1 + (self.level - 1) * 0.5) * dt
         
         for invader in self.invaders:
-            if random.random() < current_bomb_chance:
+            if self.rng.random() < current_bomb_chance:
                 bomb = Bomb(self.config, invader.rect.centerx, invader.rect.bottom)
                 self.bombs.append(bomb)
     
@@ -41,22 +41,29 @@ class Player:
         self.rect = self.image.get_rect()
         self.rect.x = config.PLAYER_START_X
         self.rect.y = config.PLAYER_START_Y
+        # Sub-pixel position; the rect is synced from it after each move
+        self.x = float(self.rect.x)
         
         self.speed = config.PLAYER_SPEED
         self.moving_left = False
         self.moving_right = False
     
-    def update(self):
-        """Update player position."""
-        # Handle movement
-        keys = pygame.key.get_pressed()
-        self.moving_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        self.moving_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+    def update(self, dt: float, moving_left: bool = False, moving_right: bool = False):
+        """Update player position.
+        
+        Args:
+            dt: Simulation step in seconds
+            moving_left: Whether the left control is held
+            moving_right: Whether the right control is held
+        """
+        self.moving_left = moving_left
+        self.moving_right = moving_right
         
         if self.moving_left and self.rect.left > 0:
-            self.rect.x -= self.speed
+            self.x = max(0.0, self.x - self.speed * dt)
         if self.moving_right and self.rect.right < self.config.SCREEN_WIDTH:
-            self.rect.x += self.speed
+            self.x = min(float(self.config.SCREEN_WIDTH - self.width), self.x + self.speed * dt)
+        self.rect.x = round(self.x)
     
     def render(self, screen):
         """Render the player on screen."""
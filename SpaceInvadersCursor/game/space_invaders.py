@@ -4,30 +4,58 @@ Main game class that handles the game loop, rendering, and overall game state.
 """
 
 import pygame
+import random
 import sys
 import threading
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from .entities.player import Player
 from .entities.invader import Invader, InvaderGroup
 from .entities.bullet import Bullet
 from .entities.explosion import Explosion
 from .ui.hud import HUD
 from .ui.game_over_screen import GameOverScreen
+from .ui.text_cache import TextCache
 from .audio.sound_manager import SoundManager
 from .config import GameConfig
 
 class SpaceInvadersGame:
     """Main game class for Space Invaders."""
     
-    def __init__(self):
-        """Initialize the game."""
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(self, headless: bool = False, controller=None, seed: Optional[int] = None):
+        """Initialize the game.
+        
+        Args:
+            headless: Run without a display or mixer. Only the simulation is
+                advanced; use run_headless() to drive it.
+            controller: Optional scripted player with a
+                ``control(game) -> (move_left, move_right, fire)`` method.
+                When set it replaces keyboard input.
+            seed: Seed for the game's random source (bomb drops) so runs
+                are reproducible.
+        
+        Raises:
+            ValueError: If headless is set without a controller; there is
+                no keyboard to read without a display.
+        """
+        if headless and controller is None:
+            raise ValueError("headless mode needs a controller to play the game")
+        self.headless = headless
+        self.controller = controller
+        self.rng = random.Random(seed)
+        
+        if self.headless:
+            pygame.font.init()
+        else:
+            pygame.init()
+            pygame.mixer.init()
         
         self.config = GameConfig()
-        self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        pygame.display.set_caption("Space Invaders")
+        if self.headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+            pygame.display.set_caption("Space Invaders")
         
         self.clock = pygame.time.Clock()
         self.running = True
@@ -38,29 +66,76 @@ class SpaceInvadersGame:
         
         # Initialize game components
         self.player = Player(self.config)
-        self.invader_group = InvaderGroup(self.config, self.level)
+        self.invader_group = InvaderGroup(self.config, self.level, self.rng)
         self.bullets: List[Bullet] = []
         self.explosions: List[Explosion] = []
-        self.hud = HUD(self.config)
-        self.game_over_screen = GameOverScreen(self.config)
-        self.sound_manager = SoundManager()
+        self.text_cache = TextCache()
+        self.hud = HUD(self.config, self.text_cache)
+        self.game_over_screen = GameOverScreen(self.config, self.text_cache)
+        self.sound_manager = SoundManager(enabled=not self.headless)
         
         # Performance tracking
         self.last_frame_time = time.time()
         self.frame_count = 0
+        self.sim_time = 0.0
         
     def run(self):
-        """Main game loop."""
+        """Main game loop.
+        
+        The simulation advances in fixed FIXED_DT steps driven by an
+        accumulator of real elapsed time, so gameplay speed no longer depends
+        on the achieved frame rate. Rendering happens once per frame.
+        """
+        fixed_dt = self.config.FIXED_DT
+        accumulator = 0.0
+        self.last_frame_time = time.perf_counter()
+        
         while self.running:
+            now = time.perf_counter()
+            accumulator += min(now - self.last_frame_time, self.config.MAX_FRAME_TIME)
+            self.last_frame_time = now
+            
             self.handle_events()
-            if not self.game_over:
-                self.update()
+            while accumulator >= fixed_dt:
+                if not self.game_over:
+                    self.update(fixed_dt)
+                accumulator -= fixed_dt
             self.render()
+            self.frame_count += 1
             self.clock.tick(self.config.FPS)
             
         pygame.quit()
         sys.exit()
     
+    def run_headless(self, max_sim_time: float = 3600.0) -> dict:
+        """Advance the simulation as fast as possible until the game ends.
+        
+        No events are polled and nothing is rendered; the controller passed
+        to __init__ plays the game.
+        
+        Args:
+            max_sim_time: Upper bound on simulated seconds before giving up
+        
+        Returns:
+            Summary with the final level, score, whether all levels were
+            cleared, the simulated time and the number of steps taken.
+        """
+        fixed_dt = self.config.FIXED_DT
+        max_steps = int(max_sim_time / fixed_dt)
+        steps = 0
+        
+        while not self.game_over and steps < max_steps:
+            self.update(fixed_dt)
+            steps += 1
+        
+        return {
+            "level": min(self.level, self.config.MAX_LEVELS),
+            "score": self.score,
+            "won": self.level > self.config.MAX_LEVELS,
+            "sim_time": self.sim_time,
+            "steps": steps,
+        }
+    
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
@@ -76,7 +151,7 @@ class SpaceInvadersGame:
     
     def handle_game_input(self, key):
         """Handle input during gameplay."""
-        if key == pygame.K_SPACE and len(self.bullets) < self.config.MAX_BULLETS and self.bullets_remaining > 0:
+        if key == pygame.K_SPACE and self.can_shoot():
             self.shoot_bullet()
         elif key == pygame.K_ESCAPE:
             self.running = False
@@ -92,19 +167,33 @@ class SpaceInvadersGame:
         elif key == pygame.K_n:
             self.running = False
     
-    def update(self):
-        """Update game state."""
+    def update(self, dt: float):
+        """Update game state.
+        
+        Args:
+            dt: Simulation step in seconds
+        """
+        self.sim_time += dt
+        
         # Update player
-        self.player.update()
+        if self.controller is not None:
+            moving_left, moving_right, fire = self.controller.control(self)
+            if fire and self.can_shoot():
+                self.shoot_bullet()
+        else:
+            keys = pygame.key.get_pressed()
+            moving_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
+            moving_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+        self.player.update(dt, moving_left, moving_right)
         
         # Update invaders
-        self.invader_group.update()
+        self.invader_group.update(dt)
         
         # Update bullets
-        self.update_bullets()
+        self.update_bullets(dt)
         
         # Update explosions
-        self.update_explosions()
+        self.update_explosions(dt)
         
         # Check collisions
         self.check_collisions()
@@ -116,30 +205,34 @@ class SpaceInvadersGame:
         # Check level completion
         self.check_level_completion()
     
-    def update_bullets(self):
+    def update_bullets(self, dt: float):
         """Update all bullets."""
         bullets_to_remove = []
         
         for bullet in self.bullets:
-            bullet.update()
+            bullet.update(dt)
             if bullet.is_off_screen():
                 bullets_to_remove.append(bullet)
         
         for bullet in bullets_to_remove:
             self.bullets.remove(bullet)
     
-    def update_explosions(self):
+    def update_explosions(self, dt: float):
         """Update all explosions."""
         explosions_to_remove = []
         
         for explosion in self.explosions:
-            explosion.update()
+            explosion.update(dt)
             if explosion.is_finished():
                 explosions_to_remove.append(explosion)
         
         for explosion in explosions_to_remove:
             self.explosions.remove(explosion)
     
+    def can_shoot(self) -> bool:
+        """Check whether the player may fire another bullet."""
+        return len(self.bullets) < self.config.MAX_BULLETS and self.bullets_remaining > 0
+    
     def shoot_bullet(self):
         """Create a new bullet."""
         bullet = Bullet(self.config, self.player.rect.centerx, self.player.rect.top)
@@ -203,7 +296,7 @@ class SpaceInvadersGame:
             self.level += 1
             if self.level <= self.config.MAX_LEVELS:
                 self.bullets_remaining = self.config.BULLETS_PER_LEVEL
-                self.invader_group = InvaderGroup(self.config, self.level)
+                self.invader_group = InvaderGroup(self.config, self.level, self.rng)
             else:
                 # Game completed - all levels beaten
                 self.game_over = True
@@ -214,14 +307,18 @@ class SpaceInvadersGame:
         self.level = 1
         self.score = 0
         self.bullets_remaining = self.config.BULLETS_PER_LEVEL
+        self.sim_time = 0.0
         
         self.player = Player(self.config)
-        self.invader_group = InvaderGroup(self.config, self.level)
+        self.invader_group = InvaderGroup(self.config, self.level, self.rng)
         self.bullets.clear()
         self.explosions.clear()
     
     def render(self):
         """Render the game."""
+        if self.headless:
+            return
+        
         # Clear screen
         self.screen.fill(self.config.BACKGROUND_COLOR)
         
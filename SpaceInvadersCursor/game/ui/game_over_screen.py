@@ -4,46 +4,58 @@ Handles game over display and restart options.
 """
 
 import pygame
+from typing import Optional
+from .text_cache import TextCache
 
 class GameOverScreen:
     """Game Over screen class."""
     
-    def __init__(self, config):
-        """Initialize the game over screen."""
+    def __init__(self, config, text_cache: Optional[TextCache] = None):
+        """Initialize the game over screen.
+        
+        Args:
+            config: Game configuration
+            text_cache: Shared text surface cache; a private one is created
+                if omitted
+        """
         self.config = config
         self.font_large = config.font_large
         self.font_medium = config.font_medium
         self.font_small = config.font_small
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        
+        # Semi-transparent overlay, built once and reused every frame
+        self.overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        self.overlay.fill(self.config.BACKGROUND_COLOR)
+        self.overlay.set_alpha(128)
+    
+    def blit_centered(self, screen, surface, y: int):
+        """Blit a surface horizontally centred at the given height."""
+        rect = surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, y))
+        screen.blit(surface, rect)
     
     def render(self, screen, final_score: int, final_level: int):
         """Render the game over screen."""
+        text = self.text_cache
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        overlay.fill(self.config.BACKGROUND_COLOR)
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.overlay, (0, 0))
         
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, self.config.RED)
-        game_over_rect = game_over_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 200))
-        screen.blit(game_over_text, game_over_rect)
+        self.blit_centered(screen, text.render(self.font_large, "GAME OVER", color=self.config.RED), 200)
         
         # Final score
-        score_text = self.font_medium.render(f"Final Score: {final_score:06d}", True, self.config.WHITE)
-        score_rect = score_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 280))
-        screen.blit(score_text, score_rect)
+        self.blit_centered(screen, text.render(self.font_medium, "Final Score: {:06d}", final_score,
+                                               color=self.config.WHITE), 280)
         
         # Level reached
-        level_text = self.font_medium.render(f"Level Reached: {final_level}", True, self.config.WHITE)
-        level_rect = level_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 320))
-        screen.blit(level_text, level_rect)
+        self.blit_centered(screen, text.render(self.font_medium, "Level Reached: {}", final_level,
+                                               color=self.config.WHITE), 320)
         
         # Play again prompt
-        play_again_text = self.font_medium.render("Play Again? (Y/N)", True, self.config.YELLOW)
-        play_again_rect = play_again_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 400))
-        screen.blit(play_again_text, play_again_rect)
+        self.blit_centered(screen, text.render(self.font_medium, "Play Again? (Y/N)",
+                                               color=self.config.YELLOW), 400)
         
         # Instructions
-        instructions_text = self.font_small.render("Press Y to restart or N to quit", True, self.config.WHITE)
-        instructions_rect = instructions_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 450))
-        screen.blit(instructions_text, instructions_rect)
+        self.blit_centered(screen, text.render(self.font_small, "Press Y to restart or N to quit",
+                                               color=self.config.WHITE), 450)
@@ -4,33 +4,40 @@ Displays score, level, bullets remaining, and other game information.
 """
 
 import pygame
+from typing import Optional
+from .text_cache import TextCache
 
 class HUD:
     """Heads-Up Display class."""
     
-    def __init__(self, config):
-        """Initialize the HUD."""
+    def __init__(self, config, text_cache: Optional[TextCache] = None):
+        """Initialize the HUD.
+        
+        Args:
+            config: Game configuration
+            text_cache: Shared text surface cache; a private one is created
+                if omitted
+        """
         self.config = config
         self.font = config.font_medium
+        self.text_cache = text_cache if text_cache is not None else TextCache()
     
     def render(self, screen, score: int, level: int, bullets_remaining: int):
         """Render the HUD on screen."""
+        text = self.text_cache
+        white = self.config.WHITE
+        
         # Score
-        score_text = self.font.render(f"SCORE: {score:06d}", True, self.config.WHITE)
-        screen.blit(score_text, (10, 10))
+        screen.blit(text.render(self.font, "SCORE: {:06d}", score, color=white), (10, 10))
         
         # Level
-        level_text = self.font.render(f"LEVEL: {level}", True, self.config.WHITE)
-        screen.blit(level_text, (10, 40))
+        screen.blit(text.render(self.font, "LEVEL: {}", level, color=white), (10, 40))
         
         # Bullets remaining
-        bullets_text = self.font.render(f"BULLETS: {bullets_remaining}", True, self.config.WHITE)
-        screen.blit(bullets_text, (10, 70))
+        screen.blit(text.render(self.font, "BULLETS: {}", bullets_remaining, color=white), (10, 70))
         
         # Lives (if implemented)
-        lives_text = self.font.render("LIVES: 1", True, self.config.WHITE)
-        screen.blit(lives_text, (self.config.SCREEN_WIDTH - 120, 10))
+        screen.blit(text.render(self.font, "LIVES: 1", color=white), (self.config.SCREEN_WIDTH - 120, 10))
         
         # High score placeholder
-        high_score_text = self.font.render("HIGH: 000000", True, self.config.WHITE)
-        screen.blit(high_score_text, (self.config.SCREEN_WIDTH - 150, 40))
+        screen.blit(text.render(self.font, "HIGH: 000000", color=white), (self.config.SCREEN_WIDTH - 150, 40))
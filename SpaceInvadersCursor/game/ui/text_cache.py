@@ -0,0 +1,59 @@
+"""
+Text surface cache for Space Invaders game.
+Keeps rendered text surfaces so unchanged HUD and menu text isn't
+rasterized again every frame.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces."""
+    
+    def __init__(self, max_entries: int = 128):
+        """Initialize the text cache.
+        
+        Args:
+            max_entries: Maximum number of surfaces kept before the least
+                recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font: pygame.font.Font, template: str, *values,
+               color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return the surface for a template filled with values.
+        
+        The values are part of the cache key, so the text is only formatted
+        and rasterized when they change.
+        
+        Args:
+            font: Font to render with
+            template: str.format template, e.g. "SCORE: {:06d}"
+            *values: Values substituted into the template
+            color: Text colour
+        """
+        key = (font, template, values, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        text = template.format(*values) if values else template
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop all cached surfaces."""
+        self.surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self.surfaces)
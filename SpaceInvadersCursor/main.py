@@ -4,15 +4,39 @@ Space Invaders Game
 A classic arcade-style Space Invaders game implementation in Python using Pygame.
 """
 
+import argparse
 import pygame
 import sys
 import os
+import time
 from game.space_invaders import SpaceInvadersGame
+from game.autopilot import ScriptedPlayer
+
+def run_headless(seed):
+    """Fast-forward a full game with the scripted player and print the result."""
+    game = SpaceInvadersGame(headless=True, controller=ScriptedPlayer(), seed=seed)
+    start = time.perf_counter()
+    result = game.run_headless()
+    elapsed = time.perf_counter() - start
+    outcome = "cleared all levels" if result["won"] else f"ended on level {result['level']}"
+    print(f"Headless run {outcome} with score {result['score']:06d}: "
+          f"{result['sim_time']:.1f}s simulated in {elapsed:.2f}s "
+          f"({result['steps']} steps)")
 
 def main():
     """Main entry point for the Space Invaders game."""
+    parser = argparse.ArgumentParser(description="Space Invaders")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation without a window using the scripted player")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for reproducible runs")
+    args = parser.parse_args()
+    
     try:
-        game = SpaceInvadersGame()
+        if args.headless:
+            run_headless(args.seed)
+            return
+        game = SpaceInvadersGame(seed=args.seed)
         game.run()
     except Exception as e:
         print(f"Error running game: {e}")
@@ -8,6 +8,7 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 TITLE = "Spider Invaders"
 FPS = 60
+STATIC_SCREEN_FPS = 20 # Menu/game over/win screens only poll input at this rate
 
 # --- Colors ---
 BLACK = (0, 0, 0)
@@ -32,7 +33,7 @@ font = pygame.font.Font(None, 36)
 try:
     shoot_sound = pygame.mixer.Sound("shoot.wav")
     hit_sound = pygame.mixer.Sound("hit.wav")
-except pygame.error as e:
+except (pygame.error, FileNotFoundError) as e:
     print(f"Warning: Could not load sound files (shoot.wav or hit.wav). Game will run without sound. Error: {e}")
     # Create silent placeholders if files are missing
     shoot_sound = pygame.mixer.Sound(b'\x00\x00\x00\x00')
@@ -41,22 +42,44 @@ except pygame.error as e:
 
 # --- Utility Functions ---
 
+# Fonts by size, and rendered text by (size, text, color)
+_fonts = {}
+_text_surfaces = {}
+TEXT_CACHE_LIMIT = 256
+
+def get_font(size):
+    """Returns the default font at the given size, loading it only once."""
+    font_size = _fonts.get(size)
+    if font_size is None:
+        font_size = _fonts[size] = pygame.font.Font(None, size)
+    return font_size
+
+def render_text(text, size, color=WHITE):
+    """Returns the rendered text surface, rendering it only the first time."""
+    key = (size, text, color)
+    text_surface = _text_surfaces.get(key)
+    if text_surface is None:
+        if len(_text_surfaces) >= TEXT_CACHE_LIMIT:
+            # HUD values keep changing; start over rather than grow forever
+            _text_surfaces.clear()
+        text_surface = _text_surfaces[key] = get_font(size).render(text, True, color)
+    return text_surface
+
 def draw_text(surf, text, size, x, y, color=WHITE):
     """Draws text onto a surface."""
-    font_size = pygame.font.Font(None, size)
-    text_surface = font_size.render(text, True, color)
+    text_surface = render_text(text, size, color)
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
     surf.blit(text_surface, text_rect)
 
-def draw_spider_invader(surf, rect):
+def draw_spider_invader(surf, rect, leg_shift=0.0):
     """Draws a stylized spider invader."""
     # Body (Purple circle)
     pygame.draw.circle(surf, PURPLE, rect.center, rect.width // 3)
     # Legs (simple lines)
     for i in range(4):
         # Draw 4 pairs of simple legs extending from the body
-        angle = math.pi / 4 + i * (math.pi / 2)
+        angle = math.pi / 4 + i * (math.pi / 2) + leg_shift
         leg_dx = math.cos(angle) * rect.width // 2
         leg_dy = math.sin(angle) * rect.width // 2
         
@@ -67,6 +90,24 @@ def draw_spider_invader(surf, rect):
         pygame.draw.line(surf, PURPLE, rect.center, 
                          (rect.centerx + leg_dx, rect.centery + leg_dy), 2)
 
+# Spider animation frames by (width, height), drawn once and shared by every invader
+_spider_frames = {}
+SPIDER_LEG_SHIFT = math.pi / 12 # Leg swing between the two frames
+
+def spider_frames(width=40, height=40):
+    """Returns the pre-rendered spider frames (legs in, legs out) for this size."""
+    frames = _spider_frames.get((width, height))
+    if frames is None:
+        frames = []
+        for leg_shift in (0.0, SPIDER_LEG_SHIFT):
+            frame = pygame.Surface([width, height])
+            frame.fill(BLACK)
+            frame.set_colorkey(BLACK)
+            draw_spider_invader(frame, frame.get_rect(), leg_shift)
+            frames.append(frame.convert())
+        _spider_frames[(width, height)] = frames
+    return frames
+
 
 # --- Game Classes ---
 
@@ -151,12 +192,15 @@ class Bomb(pygame.sprite.Sprite):
             self.kill()
 
 class Invader(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+    def __init__(self, x, y, row=0, col=0):
         super().__init__()
+        self.row = row # Grid position, used by GameController's bookkeeping
+        self.col = col
         self.width = 40
         self.height = 40
-        self.image = pygame.Surface([self.width, self.height])
-        self.image.set_colorkey(BLACK)
+        self.frames = spider_frames(self.width, self.height)
+        self.frame = 0
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -174,10 +218,13 @@ class Invader(pygame.sprite.Sprite):
         if self.move_counter >= max(1, 20 - current_speed):
             self.rect.x += direction * 10
             self.move_counter = 0
+            # Swing the legs with each step
+            self.frame ^= 1
+            self.image = self.frames[self.frame]
 
     def draw(self, surf):
-        """Custom draw method to display the spider."""
-        draw_spider_invader(surf, self.rect)
+        """Draws the spider (normally done in a batch by Group.draw)."""
+        surf.blit(self.image, self.rect)
 
     def move_down(self):
         """Moves the invader one row down."""
@@ -207,6 +254,18 @@ class GameController:
         self.max_bullets_per_level = 170
         self.can_shoot = True
 
+        # Formation bookkeeping, kept up to date as invaders die so per-frame
+        # work doesn't depend on formation size
+        self.spawn_count = 0
+        self.live_count = 0
+        self.columns = [] # Live invaders per column, top to bottom (last = front line)
+        self.rows = []    # Live invaders per row
+        self.live_columns = [] # Indices of non-empty columns, left to right
+        self.low_row = 0  # Lowest row with a live invader
+
+        # What the menu/game over/win screen last drew; they're only redrawn on change
+        self.static_screen_drawn = None
+
     def start_new_game(self):
         """Initializes game state for a new game."""
         self.game_state = "PLAYING"
@@ -232,9 +291,7 @@ class GameController:
         self.invader_direction = 1
         self.bullets_remaining = self.max_bullets_per_level
         self.can_shoot = True
-        self.invaders.empty()
-        self.player_bullets.empty()
-        self.invader_bombs.empty()
+        self.remove_sprites(self.invaders, self.player_bullets, self.invader_bombs)
 
         # Level difficulty scaling: more invaders, faster movement
         base_cols = 6
@@ -252,19 +309,46 @@ class GameController:
         self.invader_move_delay = max(5, 50 - (self.level * 3))
 
         # Create invaders
+        self.columns = [[] for _ in range(cols)]
+        self.rows = [[] for _ in range(rows)]
         for row in range(rows):
             for col in range(cols):
                 x = start_x + col * invader_gap
                 y = start_y + row * invader_gap
-                invader = Invader(x, y)
+                invader = Invader(x, y, row, col)
                 self.invaders.add(invader)
                 self.all_sprites.add(invader)
+                self.columns[col].append(invader)
+                self.rows[row].append(invader)
+        self.spawn_count = self.live_count = rows * cols
+        self.live_columns = list(range(cols))
+        self.low_row = rows - 1
+
+    def remove_sprites(self, *groups):
+        """Kills every sprite in the groups; emptying them alone would leave
+        the sprites in all_sprites, drawn but no longer updated."""
+        for group in groups:
+            for sprite in group.sprites():
+                sprite.kill()
+
+    def invader_killed(self, invader):
+        """Updates the formation bookkeeping for a destroyed invader."""
+        self.live_count -= 1
+        column = self.columns[invader.col]
+        column.remove(invader)
+        if not column:
+            self.live_columns.remove(invader.col)
+        self.rows[invader.row].remove(invader)
+        while self.low_row > 0 and not self.rows[self.low_row]:
+            self.low_row -= 1
 
     def handle_input(self):
         """Handles user input for movement and shooting."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game_state = "QUIT"
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.static_screen_drawn = None # Window contents lost; redraw
             elif event.type == pygame.KEYDOWN:
                 if self.game_state == "PLAYING":
                     if (event.key == pygame.K_SPACE or event.key == pygame.K_UP) and self.can_shoot:
@@ -292,6 +376,7 @@ class GameController:
         # 1. Player Bullet vs Invader (Constraint 4)
         hits = pygame.sprite.groupcollide(self.invaders, self.player_bullets, True, True)
         for invader in hits:
+            self.invader_killed(invader)
             self.score += 10
             hit_sound.play()
             # If an invader is hit, the bullet is automatically killed (removed from group)
@@ -307,11 +392,9 @@ class GameController:
         if pygame.sprite.spritecollide(self.shooter, self.invaders, False):
             self.game_over()
         
-        # 4. Invader vs Ground (Constraint 5)
-        for invader in self.invaders:
-            if invader.rect.bottom >= SCREEN_HEIGHT - 30: # 30 is ground level/shooter Y
-                self.game_over()
-                break
+        # 4. Invader vs Ground (Constraint 5): rows move together, so test the lowest one
+        if self.invaders and self.rows[self.low_row][0].rect.bottom >= SCREEN_HEIGHT - 30: # 30 is ground level/shooter Y
+            self.game_over()
 
         # 5. Invader Bomb vs Shooter (Constraint 19)
         if pygame.sprite.spritecollide(self.shooter, self.invader_bombs, True):
@@ -325,10 +408,8 @@ class GameController:
         
         # Speed modifier based on remaining invaders (Constraint 13)
         # Fewer invaders = higher modifier = faster step-wise movement
-        initial_count = self.level * 18 # approximation of initial count
-        current_count = len(self.invaders)
         # The modifier ranges from 1.0 (full health) to approx 2.0 (few left)
-        speed_modifier = 1 + (1 - (current_count / initial_count)) 
+        speed_modifier = 1 + (1 - (self.live_count / self.spawn_count))
         speed_modifier = max(1.0, speed_modifier)
 
         self.invader_move_timer += 1
@@ -338,16 +419,16 @@ class GameController:
             self.invader_move_timer = 0
             
             should_drop = False
-            # Check for edge collision first
-            for invader in self.invaders:
-                if invader.rect.right >= SCREEN_WIDTH - 10 and self.invader_direction == 1:
-                    should_drop = True
-                    self.invader_direction = -1
-                    break
-                elif invader.rect.left <= 10 and self.invader_direction == -1:
-                    should_drop = True
-                    self.invader_direction = 1
-                    break
+            # Check for edge collision first; columns move together, so only
+            # the outermost live columns can touch an edge
+            left = self.columns[self.live_columns[0]][-1].rect.left
+            right = self.columns[self.live_columns[-1]][-1].rect.right
+            if right >= SCREEN_WIDTH - 10 and self.invader_direction == 1:
+                should_drop = True
+                self.invader_direction = -1
+            elif left <= 10 and self.invader_direction == -1:
+                should_drop = True
+                self.invader_direction = 1
             
             # Apply movement/drop
             for invader in self.invaders:
@@ -356,25 +437,19 @@ class GameController:
                 invader.update(self.invader_direction, speed_modifier)
 
         # Bomb drop logic (Constraint 19)
-        if random.random() < self.invader_drop_chance * len(self.invaders):
-            try:
-                # Randomly select a living invader to drop a bomb
-                bomber = random.choice(list(self.invaders))
-                bomb = Bomb(bomber.rect.centerx, bomber.rect.bottom)
-                self.invader_bombs.add(bomb)
-                self.all_sprites.add(bomb)
-            except IndexError:
-                # No invaders left, ignore bomb drop attempt
-                pass
+        if random.random() < self.invader_drop_chance * self.live_count:
+            # Bombs come from the front-line invader of a random live column
+            bomber = self.columns[random.choice(self.live_columns)][-1]
+            bomb = Bomb(bomber.rect.centerx, bomber.rect.bottom)
+            self.invader_bombs.add(bomb)
+            self.all_sprites.add(bomb)
 
 
     def game_over(self):
         """Triggers Game Over state (Constraint 10)."""
         self.game_state = "GAME_OVER"
         self.shooter.hide()
-        self.invaders.empty()
-        self.invader_bombs.empty()
-        self.player_bullets.empty()
+        self.remove_sprites(self.invaders, self.invader_bombs, self.player_bullets)
 
     def show_menu(self):
         """Displays the start menu."""
@@ -406,20 +481,26 @@ class GameController:
         while self.game_state != "QUIT":
             self.handle_input()
             
-            if self.game_state == "MENU":
-                self.show_menu()
-                continue
-            
-            if self.game_state == "GAME_OVER":
-                self.show_game_over_screen()
-                continue
-                
-            if self.game_state == "WIN":
-                self.show_win_screen()
+            if self.game_state in ("MENU", "GAME_OVER", "WIN"):
+                # Static screens: draw once per change, then just poll input at a low rate
+                drawn = (self.game_state, self.score)
+                if drawn != self.static_screen_drawn:
+                    if self.game_state == "MENU":
+                        self.show_menu()
+                    elif self.game_state == "GAME_OVER":
+                        self.show_game_over_screen()
+                    else:
+                        self.show_win_screen()
+                    self.static_screen_drawn = drawn
+                clock.tick(STATIC_SCREEN_FPS)
                 continue
+            self.static_screen_drawn = None
 
             # --- Update Phase (Game State == PLAYING) ---
-            self.all_sprites.update()
+            # Invaders are stepped by update_invaders, not with the other sprites
+            self.shooter.update()
+            self.player_bullets.update()
+            self.invader_bombs.update()
             self.update_invaders()
             self.check_collisions()
 
@@ -433,14 +514,9 @@ class GameController:
             if not self.shooter.hidden:
                  self.shooter.draw_tank(screen)
             
-            # Draw Invaders (using custom drawing)
-            for invader in self.invaders:
-                invader.draw(screen)
-
-            # Draw other sprites (bullets, bombs)
-            for sprite in self.all_sprites:
-                if isinstance(sprite, Bullet) or isinstance(sprite, Bomb):
-                    screen.blit(sprite.image, sprite.rect)
+            # Draw invaders, bullets and bombs in one batch (the shooter's own
+            # image is blank; it's drawn by draw_tank above)
+            self.all_sprites.draw(screen)
 
             # Draw HUD (Score and Bullet Count - Constraints 9, 16)
             draw_text(screen, f"SCORE: {self.score}", 30, 80, 20, CYAN)
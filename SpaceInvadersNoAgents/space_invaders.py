@@ -7,7 +7,7 @@ Features (from design):
 - Bullet stops on hit; max 5 bullets in-air and 170 bullets per level
 - Score, bullets remaining, level, and game over screen with replay prompt
 - Levels up to 12; each level increases invader count/speed; invaders speed up as they are destroyed
-- Simple multithreading: sound playback worker and a small background worker for level setup
+- Simple multithreading: sound playback worker and a background worker that prefetches the next level
 
 Run: python space_invaders.py
 Requires: pygame
@@ -21,7 +21,8 @@ import threading
 import queue
 import time
 import wave
-import struct
+import hashlib
+from array import array
 
 try:
     import pygame
@@ -40,63 +41,112 @@ MAX_BULLETS_PER_LEVEL = 170
 MAX_LEVEL = 12
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
-os.makedirs(ASSETS_DIR, exist_ok=True)
 
 HIGH_SCORE_FILE = os.path.join(ASSETS_DIR, 'highscore.json')
 
+SHOT_WAV = os.path.join(ASSETS_DIR, 'shot.wav')
+HIT_WAV = os.path.join(ASSETS_DIR, 'hit.wav')
+BGM_WAV = os.path.join(ASSETS_DIR, 'bgm.wav')
 
-def generate_wav(filename, freq=440, duration=0.08, volume=0.5, sample_rate=44100, wave_type='sine'):
-    """Generate a short WAV file for simple sound effects.
-    This avoids external assets and numpy.
-    """
-    n_samples = int(sample_rate * duration)
-    amplitude = int(32767 * volume)
+
+def _tone_samples(freq, n_samples, amplitude, sample_rate, wave_type='sine'):
+    """Return n_samples of a tone as a 16-bit array (built in one pass, no per-sample I/O)."""
+    if freq <= 0:
+        return array('h', bytes(2 * n_samples))
+    # i / sample_rate (rather than a precomputed step) keeps the exact samples of earlier builds
+    k = 2 * math.pi * freq
+    if wave_type == 'square':
+        return array('h', [amplitude if math.sin(k * (i / sample_rate)) >= 0 else -amplitude for i in range(n_samples)])
+    return array('h', [int(amplitude * math.sin(k * (i / sample_rate))) for i in range(n_samples)])
+
+
+def synth_wav(freq=440, duration=0.08, volume=0.5, sample_rate=44100, wave_type='sine'):
+    """Samples for a short sound effect (see generate_wav)."""
+    return _tone_samples(freq, int(sample_rate * duration), int(32767 * volume), sample_rate, wave_type)
+
+
+def synth_bgm(sample_rate=22050):
+    """Samples for the short looping background 'tune' — a sequence of tones."""
+    melody = [440, 660, 550, 440, 0, 330, 440]
+    duration_per_note = 0.25
+    n_per_note = int(sample_rate * duration_per_note)
+    samples = array('h')
+    for freq in melody:
+        samples.extend(_tone_samples(freq, n_per_note, 16000, sample_rate))
+    return samples
+
+
+def _frame_bytes(samples):
+    # WAV data is little-endian regardless of the host
+    if sys.byteorder == 'big':
+        samples = array('h', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _write_wav(filename, samples, sample_rate):
     with wave.open(filename, 'w') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            if wave_type == 'sine':
-                sample = amplitude * math.sin(2 * math.pi * freq * t)
-            elif wave_type == 'square':
-                sample = amplitude * (1.0 if math.sin(2 * math.pi * freq * t) >= 0 else -1.0)
-            else:
-                sample = amplitude * math.sin(2 * math.pi * freq * t)
-            wf.writeframes(struct.pack('<h', int(sample)))
+        wf.writeframes(_frame_bytes(samples))
+
+
+def generate_wav(filename, freq=440, duration=0.08, volume=0.5, sample_rate=44100, wave_type='sine'):
+    """Generate a short WAV file for simple sound effects.
+    This avoids external assets and numpy.
+    """
+    _write_wav(filename, synth_wav(freq, duration, volume, sample_rate, wave_type), sample_rate)
 
 
 def generate_bgm(filename, sample_rate=22050):
     """Generate a short looping background 'tune' and save as WAV.
     Keeps it very light-weight — sequence of tones.
     """
-    melody = [440, 660, 550, 440, 0, 330, 440]
-    duration_per_note = 0.25
-    n_samples = int(sample_rate * duration_per_note * len(melody))
-    amplitude = int(16000)
-    with wave.open(filename, 'w') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        for freq in melody:
-            for i in range(int(sample_rate * duration_per_note)):
-                t = float(i) / sample_rate
-                if freq <= 0:
-                    sample = 0
-                else:
-                    sample = amplitude * math.sin(2 * math.pi * freq * t)
-                wf.writeframes(struct.pack('<h', int(sample)))
+    _write_wav(filename, synth_bgm(sample_rate), sample_rate)
 
 
-SHOT_WAV = os.path.join(ASSETS_DIR, 'shot.wav')
-HIT_WAV = os.path.join(ASSETS_DIR, 'hit.wav')
-BGM_WAV = os.path.join(ASSETS_DIR, 'bgm.wav')
-if not os.path.exists(SHOT_WAV):
-    generate_wav(SHOT_WAV, freq=1200, duration=0.06, volume=0.3, wave_type='square')
-if not os.path.exists(HIT_WAV):
-    generate_wav(HIT_WAV, freq=600, duration=0.12, volume=0.4, wave_type='sine')
-if not os.path.exists(BGM_WAV):
-    generate_bgm(BGM_WAV)
+# SHA-256 of each generated asset file. A file that hashes to anything else
+# (missing, stale or cut short) is synthesized again; matching files are left
+# alone without synthesizing anything.
+SOUND_ASSET_SHA256 = {
+    'shot.wav': 'f89801fe66615f1675b9d6b8b53400e497d7e457a242f7a97ce58c1ffa95ea9a',
+    'hit.wav': '94a2e6298db327f73f99c0172049a18891ce380dc383a6017a7802b03d0dbd7c',
+    'bgm.wav': 'f5a649dbcb4656cecb350f6c842ece774ac119163a16be0674be1a79cc0dff9b',
+}
+
+
+def synth_asset(name):
+    """Return (samples, sample_rate) for one of the SOUND_ASSET_SHA256 files."""
+    if name == 'shot.wav':
+        return synth_wav(freq=1200, duration=0.06, volume=0.3, wave_type='square'), 44100
+    if name == 'hit.wav':
+        return synth_wav(freq=600, duration=0.12, volume=0.4, wave_type='sine'), 44100
+    if name == 'bgm.wav':
+        return synth_bgm(), 22050
+    raise ValueError(f'unknown sound asset: {name}')
+
+
+def _file_sha256(filename):
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def ensure_sound_assets(assets_dir=None):
+    """Create the sound effect and music WAVs, rewriting any that are missing, stale or partial.
+
+    Called on first SoundWorker init, so importing this module does no file I/O.
+    """
+    assets_dir = assets_dir or ASSETS_DIR
+    os.makedirs(assets_dir, exist_ok=True)
+    for name, digest in SOUND_ASSET_SHA256.items():
+        path = os.path.join(assets_dir, name)
+        if _file_sha256(path) != digest:
+            samples, sample_rate = synth_asset(name)
+            _write_wav(path, samples, sample_rate)
 
 
 class SoundWorker(threading.Thread):
@@ -107,6 +157,7 @@ class SoundWorker(threading.Thread):
         self.q = queue.Queue()
         self._stop = threading.Event()
         self.sounds = {}
+        ensure_sound_assets()
         # initialize mixer here to avoid threading issues
         pygame.mixer.init()
         self.sounds['shot'] = pygame.mixer.Sound(SHOT_WAV)
@@ -213,8 +264,39 @@ INVADER_PATTERNS = [
     ],
 ]
 
+INVADER_SCALE = 5  # make spiders bigger
+INVADER_COLOR = (150, 50, 180)
+INVADER_FRAME_INTERVAL = 0.32  # seconds between animation frames (slightly faster)
+
+# Shared animation frames, keyed by (pattern index, converted for the display)
+_invader_frames = {}
+
+
+def invader_frames(pattern_index):
+    """Return the two animation frames for an invader pattern, built once and shared.
+
+    Once a display mode is set the frames are convert_alpha()'d to the
+    display format so blits don't have to convert pixels every frame.
+    """
+    pattern_index %= len(INVADER_PATTERNS)
+    converted = pygame.display.get_surface() is not None
+    key = (pattern_index, converted)
+    frames = _invader_frames.get(key)
+    if frames is None:
+        frames = [make_pixel_surface(f, scale=INVADER_SCALE, fg=INVADER_COLOR)
+                  for f in INVADER_PATTERNS[pattern_index]]
+        if converted:
+            frames = [f.convert_alpha() for f in frames]
+        _invader_frames[key] = frames
+    return frames
+
+
+# Entities keep one Rect each, updated in place whenever they move, so the
+# collision and draw paths don't allocate per frame.
 
 class Player:
+    __slots__ = ('x', 'y', 'w', 'h', 'speed', 'surface', 'rect')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -222,15 +304,19 @@ class Player:
         self.h = 20
         self.speed = PLAYER_SPEED
         self.surface = make_pixel_surface(PLAYER_PIX, scale=4, fg=(0, 180, 255))
+        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
 
-    def rect(self):
-        return pygame.Rect(self.x, self.y, self.w, self.h)
+    def move(self, dx):
+        self.x = min(max(0, self.x + dx), SCREEN_W - self.w)
+        self.rect.x = self.x
 
     def draw(self, screen):
         screen.blit(self.surface, (self.x + (self.w - self.surface.get_width()) // 2, self.y))
 
 
 class Bullet:
+    __slots__ = ('x', 'y', 'dy', 'w', 'h', 'color', 'active', 'rect')
+
     def __init__(self, x, y, dy):
         self.x = x
         self.y = y
@@ -238,45 +324,42 @@ class Bullet:
         self.w = 4
         self.h = 10
         self.color = (255, 255, 0)
+        self.active = True  # cleared on hit or when off-screen; Game compacts the list
+        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
 
     def update(self):
         self.y += self.dy
-
-    def rect(self):
-        return pygame.Rect(self.x, self.y, self.w, self.h)
+        self.rect.y = self.y
 
     def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect())
+        screen.fill(self.color, self.rect)
 
 
 class Invader:
+    __slots__ = ('x', 'y', 'alive', 'pattern_index', 'surfaces', 'w', 'h', 'rect')
+
     def __init__(self, x, y, pattern_index=0):
         # store positions as floats for smooth movement
         self.x = float(x)
         self.y = float(y)
         self.alive = True
         self.pattern_index = pattern_index
-        # create two-frame animation surfaces for this invader
-        frames = INVADER_PATTERNS[self.pattern_index % len(INVADER_PATTERNS)]
-        # make spiders bigger (scale 5)
-        self.surfaces = [make_pixel_surface(f, scale=5, fg=(150, 50, 180)) for f in frames]
-        self.frame_index = 0
-        self.last_frame_time = time.time()
-        self.frame_interval = 0.32  # seconds between frames (slightly faster)
+        # two-frame animation surfaces, shared by every invader with this pattern
+        self.surfaces = invader_frames(self.pattern_index)
         self.w = self.surfaces[0].get_width()
         self.h = self.surfaces[0].get_height()
+        self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
 
-    def rect(self):
-        return pygame.Rect(self.x, self.y, self.w, self.h)
+    def move(self, dx, dy):
+        self.x += dx
+        self.y += dy
+        # truncate like pygame.Rect(x, y, ...) does (attribute assignment rounds)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
 
-    def draw(self, screen):
+    def draw(self, screen, frame_index=0):
         if self.alive:
-            # toggle frame based on time
-            now = time.time()
-            if now - self.last_frame_time >= self.frame_interval:
-                self.frame_index = (self.frame_index + 1) % len(self.surfaces)
-                self.last_frame_time = now
-            screen.blit(self.surfaces[self.frame_index], (self.x, self.y))
+            screen.blit(self.surfaces[frame_index], (self.x, self.y))
 
 
 class Game:
@@ -292,9 +375,17 @@ class Game:
         self.font = pygame.font.SysFont('Arial', 20)
         self.large_font = pygame.font.SysFont('Arial', 44)
 
+        # one animation clock for all invaders (they always share a frame)
+        self.anim_time = 0.0
+        self.invader_frame = 0
+
+        # background worker builds the next level while the current one is played
+        self.level_requests = queue.Queue()
+        self.prefetched = {}
+        self.prefetch_lock = threading.Lock()
+
         self.reset_game()
 
-        # background worker for level setup (demonstrates threading requirement)
         self.bg_worker = threading.Thread(target=self._bg_worker_loop, daemon=True)
         self.bg_worker.start()
         # track whether space is currently held to allow one shot per press
@@ -331,37 +422,57 @@ class Game:
         try:
             import json
             data = {'high_score': max(self.high_score, self.score)}
+            os.makedirs(ASSETS_DIR, exist_ok=True)
             with open(HIGH_SCORE_FILE, 'w') as f:
                 json.dump(data, f)
         except Exception:
             pass
 
     def spawn_level(self, level):
-        # Increase invader count & speed with level
+        # Use the layout the background worker prepared, if it's ready
+        with self.prefetch_lock:
+            invaders = self.prefetched.pop(level, None)
+        if invaders is None:
+            invaders = self.build_invaders(level)
+        self.invaders = invaders
+        # base speed decreases interval between moves
+        # make invaders faster: significantly shorter base interval and larger dx per move
+        base = max(0.45 - (level - 1) * 0.03, 0.04)
+        self.move_interval = base
+        # higher base speed and bigger per-level increase
+        self.invader_speed = 2.0 + (level - 1) * 0.6
+        self.bullets_remaining = MAX_BULLETS_PER_LEVEL
+        if level < MAX_LEVEL:
+            self.level_requests.put(level + 1)
+
+    def build_invaders(self, level):
+        # Increase invader count with level
         rows = min(5 + level // 2, 7)
         cols = min(6 + level, 12)
         margin_x = 40
         margin_y = 60
         spacing_x = (SCREEN_W - 2 * margin_x) // cols
         spacing_y = 40
-        self.invaders = []
+        invaders = []
         for r in range(rows):
             for c in range(cols):
                 x = margin_x + c * spacing_x + (spacing_x - 30) // 2
                 y = margin_y + r * spacing_y
-                self.invaders.append(Invader(x, y, pattern_index=(r + c) % len(INVADER_PATTERNS)))
-        # base speed decreases interval between moves
-        # make invaders faster: significantly shorter base interval and larger dx per move
-        base = max(0.45 - (level - 1) * 0.03, 0.04)
-        self.move_interval = base
-        # higher base speed and bigger per-level increase
-        self.invader_speed = 2.0 + (level - 1) * 0.6
-        self.bullets_remaining = MAX_BULLETS_PER_LEVEL
+                invaders.append(Invader(x, y, pattern_index=(r + c) % len(INVADER_PATTERNS)))
+        return invaders
 
     def _bg_worker_loop(self):
-        # background worker placeholder: could preload assets or compute level prep
+        # level prefetcher: builds the invaders for each requested level so
+        # spawn_level only has to swap them in when the current level is cleared
         while self.running:
-            time.sleep(1.0)
+            try:
+                level = self.level_requests.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            invaders = self.build_invaders(level)
+            with self.prefetch_lock:
+                # keep only the most recent request; replays restart from level 1
+                self.prefetched = {level: invaders}
 
     def play_sound(self, name):
         self.sound_worker.play(name)
@@ -371,11 +482,18 @@ class Game:
             dt = self.clock.tick(FPS) / 1000.0
             self.handle_events()
             self.update(dt)
+            self.advance_animation(dt)
             self.draw()
 
         self.sound_worker.stop()
         pygame.quit()
 
+    def advance_animation(self, dt):
+        self.anim_time += dt
+        if self.anim_time >= INVADER_FRAME_INTERVAL:
+            self.anim_time %= INVADER_FRAME_INTERVAL
+            self.invader_frame = (self.invader_frame + 1) % 2
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -393,9 +511,9 @@ class Game:
 
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.player.x = max(0, self.player.x - self.player.speed)
+            self.player.move(-self.player.speed)
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.player.x = min(SCREEN_W - self.player.w, self.player.x + self.player.speed)
+            self.player.move(self.player.speed)
 
     def try_shoot(self):
         # enforce both active bullets limit and total bullets per level
@@ -412,10 +530,10 @@ class Game:
 
     def update(self, dt):
         # Update bullets
-        for b in list(self.bullets):
+        for b in self.bullets:
             b.update()
             if b.y < -50 or b.y > SCREEN_H + 50:
-                self.bullets.remove(b)
+                b.active = False
 
         # Invader movement timing
         now = time.time()
@@ -424,23 +542,24 @@ class Game:
             self.last_move_time = now
 
         # Check collisions: bullets vs invaders
-        for b in list(self.bullets):
+        for b in self.bullets:
+            if not b.active:
+                continue
             for inv in self.invaders:
-                if inv.alive and b.rect().colliderect(inv.rect()):
+                if inv.alive and b.rect.colliderect(inv.rect):
                     inv.alive = False
-                    try:
-                        self.bullets.remove(b)
-                    except ValueError:
-                        pass
+                    b.active = False
                     self.score += 10
                     self.play_sound('hit')
                     break
+        # drop spent bullets in one pass
+        self.bullets = [b for b in self.bullets if b.active]
 
         # Check invaders vs player or ground
         for inv in self.invaders:
             if not inv.alive:
                 continue
-            if inv.rect().colliderect(self.player.rect()):
+            if inv.rect.colliderect(self.player.rect):
                 self.game_over()
                 return
             if inv.y + inv.h >= self.player.y:
@@ -475,20 +594,21 @@ class Game:
         if right + dx >= SCREEN_W - 10 or left + dx <= 10:
             for inv in self.invaders:
                 if inv.alive:
-                    inv.y += INVADER_DROP
+                    inv.move(0, INVADER_DROP)
             self.invader_direction *= -1
         else:
             for inv in self.invaders:
                 if inv.alive:
-                    inv.x += dx
+                    inv.move(dx, 0)
 
     def draw(self):
         self.screen.fill((10, 10, 30))
         # Draw player
         self.player.draw(self.screen)
-        # Draw invaders
-        for inv in self.invaders:
-            inv.draw(self.screen)
+        # Draw invaders in one batch
+        frame = self.invader_frame
+        self.screen.blits([(inv.surfaces[frame], (inv.x, inv.y)) for inv in self.invaders if inv.alive],
+                          doreturn=False)
         # Draw bullets
         for b in self.bullets:
             b.draw(self.screen)
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+# Headless: Game() opens a window and the mixer, so use SDL's dummy drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(monkeypatch):
+    """A Game built by its real constructor, with its worker threads stopped afterwards."""
+    import pygame
+    from space_invaders import Game
+
+    g = Game()
+
+    # the game-over screen waits for a key press; no test should end up there
+    def game_over():
+        raise AssertionError("unexpected game over")
+
+    monkeypatch.setattr(g, "game_over", game_over)
+    yield g
+    g.running = False
+    g.sound_worker.stop()
+    g.bg_worker.join(timeout=2)
+    pygame.quit()